@@ -8,19 +8,22 @@ Format: {"ips": [{"ip_address": "x.x.x.x"}, ...]}
 
 import os
 import sys
-import json
 import logging
 import requests
 
 from .ip_utils import (
     separate_ipv4_ipv6,
-    write_separated_ip_files,
     generate_index_markdown,
-    calculate_total_ips,
     print_summary,
     ensure_directory,
-    is_valid_ip,
-    calculate_detailed_stats
+    filter_valid_ips,
+    calculate_detailed_stats,
+    json_loads,
+    get_session,
+    load_config,
+    write_all_splits,
+    separate_single_ips_and_ranges,
+    write_packed_ipv4
 )
 
 logger = logging.getLogger(__name__)
@@ -29,9 +32,10 @@ logger = logging.getLogger(__name__)
 class AhrefsIP:
     """Ahrefs IP addresses synchronization manager."""
 
+    __slots__ = ('url', 'output_dir')
+
     def __init__(self, config_path: str = "config.json"):
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = load_config(config_path)
         self.url = config['ahrefs']['url']
         self.output_dir = os.path.join("cloud_ips", "ahrefs")
 
@@ -46,21 +50,22 @@ class AhrefsIP:
 
         logger.info(f"Downloading from: {self.url}")
         try:
-            response = requests.get(self.url, timeout=30)
+            response = get_session().get(self.url, timeout=30)
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
 
             # Extract IPs from the ips array
             ips_array = data.get('ips', [])
-            for entry in ips_array:
-                if isinstance(entry, dict):
-                    ip = entry.get('ip_address', '')
-                    if ip and is_valid_ip(ip):
-                        all_ips.append(ip)
+            get = dict.get
+            candidates = [
+                ip for entry in ips_array
+                if isinstance(entry, dict) and (ip := get(entry, 'ip_address'))
+            ]
+            all_ips = filter_valid_ips(candidates)
 
             logger.info(f"Downloaded {len(all_ips)} IP addresses")
 
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             logger.error(f"Error downloading from {self.url}: {e}")
 
         return all_ips
@@ -80,11 +85,12 @@ class AhrefsIP:
 
         # Generate global files
         logger.info("Generating global files...")
-        all_combined = all_ipv4 + all_ipv6
-        base_path = os.path.join(self.output_dir, "ips")
-        write_separated_ip_files(base_path, all_combined, "all")
-        write_separated_ip_files(base_path, all_ipv4, "ipv4")
-        write_separated_ip_files(base_path, all_ipv6, "ipv6")
+        # Write global files with separation of single IPs and ranges
+        write_all_splits(os.path.join(self.output_dir, "ips"), all_ipv4, all_ipv6)
+
+        # Packed binary copy of the single IPv4 addresses
+        ipv4_single, _ = separate_single_ips_and_ranges(all_ipv4)
+        write_packed_ipv4(os.path.join(self.output_dir, "ips_single_ipv4.bin"), ipv4_single)
 
         # Calculate detailed stats
         detailed_stats = calculate_detailed_stats(all_ips_list, all_ipv4, all_ipv6)
@@ -97,7 +103,7 @@ class AhrefsIP:
             ipv4_ranges=detailed_stats['ipv4_ranges'],
             ipv6_ranges=detailed_stats['ipv6_ranges'],
             ipv4_count=detailed_stats['ipv4_count'],
-            ipv6_count=calculate_total_ips(all_ipv6),
+            ipv6_count=detailed_stats['ipv6_count'],
             services=None,
             regions=None,
             ipv4_single=detailed_stats['ipv4_single'],
@@ -8,20 +8,24 @@ IP range files organized by services and regions.
 
 import os
 import sys
-import json
 import logging
 import requests
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 # Import shared utilities
 from .ip_utils import (
     separate_ipv4_ipv6,
-    write_separated_ip_files,
+    split_buckets_by_family,
     generate_index_markdown,
-    calculate_total_ips,
-    sanitize_filename,
+    write_bucket_files,
     print_summary,
     ensure_directory,
-    calculate_detailed_stats
+    calculate_detailed_stats,
+    get_session,
+    json_loads,
+    load_config,
+    write_all_splits
 )
 
 logger = logging.getLogger(__name__)
@@ -30,6 +34,8 @@ logger = logging.getLogger(__name__)
 class AWSIP:
     """AWS IP ranges synchronization manager."""
 
+    __slots__ = ('url', 'output_dir', 'services_dir', 'regions_dir', 'data')
+
     def __init__(self, config_path: str = "config.json"):
         """
         Initialize the AWS IP Sync manager.
@@ -37,8 +43,7 @@ class AWSIP:
         Args:
             config_path: Path to configuration file
         """
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = load_config(config_path)
 
         self.url = config['aws']['url']
         self.output_dir = os.path.join("cloud_ips", "aws")
@@ -58,9 +63,10 @@ class AWSIP:
         """
         logger.info(f"Downloading from: {self.url}")
         try:
-            response = requests.get(self.url, timeout=60)
+            response = get_session().get(self.url, timeout=60)
             response.raise_for_status()
-            self.data = response.json()
+
+            self.data = json_loads(response.content)
             sync_token = self.data.get('syncToken', 'N/A')
             create_date = self.data.get('createDate', 'N/A')
             logger.info(f"Successfully downloaded (sync token: {sync_token}, date: {create_date})")
@@ -73,64 +79,39 @@ class AWSIP:
         """
         Extract all IP ranges organized by service and region.
 
+        Service and region buckets are split by family while extracting, since
+        AWS already lists IPv4 and IPv6 prefixes separately.
+
         Returns:
             Tuple of (services_ips, regions_ips, all_ips)
-            - services_ips: Dict mapping service names to IP sets
-            - regions_ips: Dict mapping region names to IP sets
-            - all_ips: Set of all IP ranges
+            - services_ips: Dict mapping service names to (IPv4 set, IPv6 set)
+            - regions_ips: Dict mapping region names to (IPv4 set, IPv6 set)
+            - all_ips: Frozenset of all IP ranges
         """
         if not self.data:
             raise ValueError("Data not loaded. Call download_data() first.")
 
-        services_ips = {}
-        regions_ips = {}
+        services_ips = defaultdict(lambda: (set(), set()))
+        regions_ips = defaultdict(lambda: (set(), set()))
         all_ips = set()
 
-        # Process IPv4 prefixes
-        for prefix in self.data.get("prefixes", []):
-            ip_prefix = prefix.get("ip_prefix")
-            service = prefix.get("service", "UNKNOWN")
-            region = prefix.get("region", "GLOBAL")
-
-            if not ip_prefix:
-                continue
-
-            # Add to services
-            if service not in services_ips:
-                services_ips[service] = set()
-            services_ips[service].add(ip_prefix)
-
-            # Add to regions
-            if region not in regions_ips:
-                regions_ips[region] = set()
-            regions_ips[region].add(ip_prefix)
-
-            # Add to all IPs
-            all_ips.add(ip_prefix)
-
-        # Process IPv6 prefixes
-        for prefix in self.data.get("ipv6_prefixes", []):
-            ipv6_prefix = prefix.get("ipv6_prefix")
-            service = prefix.get("service", "UNKNOWN")
-            region = prefix.get("region", "GLOBAL")
-
-            if not ipv6_prefix:
-                continue
-
-            # Add to services
-            if service not in services_ips:
-                services_ips[service] = set()
-            services_ips[service].add(ipv6_prefix)
+        # IPv4 and IPv6 prefixes share the same layout, only the key differs
+        prefix_lists = (
+            (0, "ip_prefix", self.data.get("prefixes", ())),
+            (1, "ipv6_prefix", self.data.get("ipv6_prefixes", ())),
+        )
 
-            # Add to regions
-            if region not in regions_ips:
-                regions_ips[region] = set()
-            regions_ips[region].add(ipv6_prefix)
+        for family, key, prefixes in prefix_lists:
+            for prefix in prefixes:
+                ip_prefix = prefix.get(key)
+                if not ip_prefix:
+                    continue
 
-            # Add to all IPs
-            all_ips.add(ipv6_prefix)
+                services_ips[prefix.get("service", "UNKNOWN")][family].add(ip_prefix)
+                regions_ips[prefix.get("region", "GLOBAL")][family].add(ip_prefix)
+                all_ips.add(ip_prefix)
 
-        return services_ips, regions_ips, all_ips
+        return services_ips, regions_ips, frozenset(all_ips)
 
     def generate_files(self) -> None:
         """
@@ -151,65 +132,36 @@ class AWSIP:
         logger.info("Extracting IPs by service and region...")
         services_ips, regions_ips, all_ips = self.extract_ips()
 
-        # Convert sets to lists and separate IPv4/IPv6
+        # Separate IPv4/IPv6 (straight from the deduplicated set)
         logger.info("Separating IPv4/IPv6...")
-        all_ips_list = list(all_ips)
-        all_ipv4, all_ipv6 = separate_ipv4_ipv6(all_ips_list)
+        all_ipv4, all_ipv6 = separate_ipv4_ipv6(all_ips)
 
-        # Generate global files
+        # Global, per-service and per-region files are independent: write them concurrently
         logger.info("Generating global files...")
-        all_combined = all_ipv4 + all_ipv6
-        # Write global files with separation of single IPs and ranges
-        base_path = os.path.join(self.output_dir, "ips")
-        write_separated_ip_files(base_path, all_combined, "all")
-        write_separated_ip_files(base_path, all_ipv4, "ipv4")
-        write_separated_ip_files(base_path, all_ipv6, "ipv6")
-
-        # Generate per-service files
         logger.info(f"Generating service files ({len(services_ips)} services)...")
-        service_counts = {}
-        for service_name, ips in services_ips.items():
-            safe_name = sanitize_filename(service_name)
-            ips_list = list(ips)
-            ipv4, ipv6 = separate_ipv4_ipv6(ips_list)
-
-            # Write files with separation of single IPs and ranges
-            base_path = os.path.join(self.services_dir, safe_name)
-            all_combined = ipv4 + ipv6
-            write_separated_ip_files(base_path, all_combined, "all")
-
-            # Write IPv4 if present
-            if ipv4:
-                write_separated_ip_files(base_path, ipv4, "ipv4")
-
-            # Write IPv6 if present
-            if ipv6:
-                write_separated_ip_files(base_path, ipv6, "ipv6")
-
-            service_counts[service_name] = len(ips)
-
-        # Generate per-region files
         logger.info(f"Generating region files ({len(regions_ips)} regions)...")
-        region_counts = {}
-        for region_name, ips in regions_ips.items():
-            safe_name = sanitize_filename(region_name)
-            ips_list = list(ips)
-            ipv4, ipv6 = separate_ipv4_ipv6(ips_list)
-
-            # Write files with separation of single IPs and ranges
-            base_path = os.path.join(self.regions_dir, safe_name)
-            all_combined = ipv4 + ipv6
-            write_separated_ip_files(base_path, all_combined, "all")
-
-            # Write IPv4 if present
-            if ipv4:
-                write_separated_ip_files(base_path, ipv4, "ipv4")
-
-            # Write IPv6 if present
-            if ipv6:
-                write_separated_ip_files(base_path, ipv6, "ipv6")
-
-            region_counts[region_name] = len(ips)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            # Write global files with separation of single IPs and ranges
+            global_files = executor.submit(
+                write_all_splits, os.path.join(self.output_dir, "ips"), all_ipv4, all_ipv6
+            )
+            # Keep only validated ranges in the buckets, like the global files
+            service_files = executor.submit(
+                write_bucket_files,
+                self.services_dir,
+                split_buckets_by_family(services_ips, all_ipv4, all_ipv6),
+                presplit=True
+            )
+            region_files = executor.submit(
+                write_bucket_files,
+                self.regions_dir,
+                split_buckets_by_family(regions_ips, all_ipv4, all_ipv6),
+                presplit=True
+            )
+
+            global_files.result()
+            service_counts = service_files.result()
+            region_counts = region_files.result()
 
         # Calculate detailed stats
         detailed_stats = calculate_detailed_stats(all_ips, all_ipv4, all_ipv6)
@@ -222,7 +174,7 @@ class AWSIP:
             ipv4_ranges=detailed_stats['ipv4_ranges'],
             ipv6_ranges=detailed_stats['ipv6_ranges'],
             ipv4_count=detailed_stats['ipv4_count'],
-            ipv6_count=calculate_total_ips(all_ipv6),
+            ipv6_count=detailed_stats['ipv6_count'],
             services=service_counts,
             regions=region_counts,
             ipv4_single=detailed_stats['ipv4_single'],
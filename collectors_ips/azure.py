@@ -8,19 +8,22 @@ IP range files organized by services and regions.
 
 import os
 import sys
-import json
 import logging
 import requests
+from itertools import chain
 
 # Import shared utilities
 from .ip_utils import (
     separate_ipv4_ipv6,
     write_separated_ip_files,
     generate_index_markdown,
-    calculate_total_ips,
     sanitize_filename,
     print_summary,
-    ensure_directory
+    ensure_directory,
+    write_all_splits,
+    load_config,
+    json_loads,
+    get_session
 )
 
 logger = logging.getLogger(__name__)
@@ -36,8 +39,7 @@ class AzureIP:
         Args:
             config_path: Path to configuration file
         """
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = load_config(config_path)
 
         self.url = config['azure']['url']
         self.output_dir = os.path.join("cloud_ips", "azure")
@@ -57,13 +59,13 @@ class AzureIP:
         """
         logger.info(f"Downloading from: {self.url}")
         try:
-            response = requests.get(self.url, timeout=60)
+            response = get_session().get(self.url, timeout=60)
             response.raise_for_status()
-            self.data = response.json()
+            self.data = json_loads(response.content)
             version = self.data.get('changeNumber', 'N/A')
             logger.info(f"Successfully downloaded (version: {version})")
             return self.data
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             logger.error(f"Error downloading data: {e}")
             raise
 
@@ -139,12 +141,8 @@ class AzureIP:
 
         # Generate global files
         logger.info("Generating global files...")
-        all_combined = all_ipv4 + all_ipv6
         # Write global files with separation of single IPs and ranges
-        base_path = os.path.join(self.output_dir, "ips")
-        write_separated_ip_files(base_path, all_combined, "all")
-        write_separated_ip_files(base_path, all_ipv4, "ipv4")
-        write_separated_ip_files(base_path, all_ipv6, "ipv6")
+        write_all_splits(os.path.join(self.output_dir, "ips"), all_ipv4, all_ipv6)
 
         # Generate per-service files
         logger.info(f"Generating service files ({len(services_ips)} services)...")
@@ -156,8 +154,7 @@ class AzureIP:
 
             # Write files with separation of single IPs and ranges
             base_path = os.path.join(self.services_dir, safe_name)
-            all_combined = ipv4 + ipv6
-            write_separated_ip_files(base_path, all_combined, "all")
+            write_separated_ip_files(base_path, chain(ipv4, ipv6), "all")
 
             # Write IPv4 if present
             if ipv4:
@@ -179,8 +176,7 @@ class AzureIP:
 
             # Write files with separation of single IPs and ranges
             base_path = os.path.join(self.regions_dir, safe_name)
-            all_combined = ipv4 + ipv6
-            write_separated_ip_files(base_path, all_combined, "all")
+            write_separated_ip_files(base_path, chain(ipv4, ipv6), "all")
 
             # Write IPv4 if present
             if ipv4:
@@ -204,7 +200,7 @@ class AzureIP:
             ipv4_ranges=detailed_stats['ipv4_ranges'],
             ipv6_ranges=detailed_stats['ipv6_ranges'],
             ipv4_count=detailed_stats['ipv4_count'],
-            ipv6_count=calculate_total_ips(all_ipv6),
+            ipv6_count=detailed_stats['ipv6_count'],
             services=service_counts,
             regions=region_counts,
             ipv4_single=detailed_stats['ipv4_single'],
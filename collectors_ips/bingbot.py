@@ -7,19 +7,19 @@ Bingbot provides a JSON file with IPv4 prefixes used by Bing's crawlers.
 
 import os
 import sys
-import json
 import logging
 import requests
 
 from .ip_utils import (
     separate_ipv4_ipv6,
-    write_separated_ip_files,
     generate_index_markdown,
-    calculate_total_ips,
     print_summary,
     ensure_directory,
     is_valid_ip,
-    calculate_detailed_stats
+    calculate_detailed_stats,
+    write_all_splits,
+    load_config,
+    json_loads
 )
 
 logger = logging.getLogger(__name__)
@@ -29,8 +29,7 @@ class BingbotIP:
     """Bingbot IP ranges synchronization manager."""
 
     def __init__(self, config_path: str = "config.json"):
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = load_config(config_path)
         self.url = config['bingbot']['url']
         self.output_dir = os.path.join("cloud_ips", "bingbot")
 
@@ -39,10 +38,10 @@ class BingbotIP:
         try:
             response = requests.get(self.url, timeout=30)
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
             logger.info("Successfully downloaded JSON data")
             return data
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             logger.error(f"Error: {e}")
             return {}
 
@@ -88,11 +87,8 @@ class BingbotIP:
 
         # Generate global files
         logger.info("Generating global files...")
-        all_combined = all_ipv4 + all_ipv6
-        base_path = os.path.join(self.output_dir, "ips")
-        write_separated_ip_files(base_path, all_combined, "all")
-        write_separated_ip_files(base_path, all_ipv4, "ipv4")
-        write_separated_ip_files(base_path, all_ipv6, "ipv6")
+        # Write global files with separation of single IPs and ranges
+        write_all_splits(os.path.join(self.output_dir, "ips"), all_ipv4, all_ipv6)
 
         # Calculate detailed stats
         detailed_stats = calculate_detailed_stats(all_ips_list, all_ipv4, all_ipv6)
@@ -105,7 +101,7 @@ class BingbotIP:
             ipv4_ranges=detailed_stats['ipv4_ranges'],
             ipv6_ranges=detailed_stats['ipv6_ranges'],
             ipv4_count=detailed_stats['ipv4_count'],
-            ipv6_count=calculate_total_ips(all_ipv6),
+            ipv6_count=detailed_stats['ipv6_count'],
             services=None,
             regions=None,
             ipv4_single=detailed_stats['ipv4_single'],
@@ -7,21 +7,22 @@ Cloudflare provides simple text files with one CIDR per line for IPv4 and IPv6.
 
 import os
 import sys
-import json
 import logging
 import requests
 from typing import List
+from concurrent.futures import ThreadPoolExecutor
 
 # Import shared utilities
 from .ip_utils import (
     separate_ipv4_ipv6,
-    write_separated_ip_files,
     generate_index_markdown,
-    calculate_total_ips,
     print_summary,
     ensure_directory,
-    is_valid_ip,
-    calculate_detailed_stats
+    filter_valid_ips,
+    calculate_detailed_stats,
+    get_session,
+    load_config,
+    write_all_splits
 )
 
 logger = logging.getLogger(__name__)
@@ -30,6 +31,8 @@ logger = logging.getLogger(__name__)
 class CloudflareIP:
     """Cloudflare IP ranges synchronization manager."""
 
+    __slots__ = ('urls', 'output_dir')
+
     def __init__(self, config_path: str = "config.json"):
         """
         Initialize the Cloudflare IP Sync manager.
@@ -37,38 +40,51 @@ class CloudflareIP:
         Args:
             config_path: Path to configuration file
         """
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = load_config(config_path)
 
         self.urls = config['cloudflare']['urls']
         self.output_dir = os.path.join("cloud_ips", "cloudflare")
 
+    def _download_url(self, url: str) -> List[str]:
+        """
+        Download one Cloudflare text file.
+
+        Args:
+            url: URL of the text file (one CIDR per line)
+
+        Returns:
+            List of valid IP ranges (empty on download error)
+        """
+        logger.info(f"Downloading from: {url}")
+        try:
+            response = get_session().get(url, timeout=30)
+            response.raise_for_status()
+
+            # Parse text file (one IP per line)
+            lines = response.text.strip().split('\n')
+            ips = filter_valid_ips(line.strip() for line in lines)
+
+            logger.info(f"Downloaded {len(lines)} IPs from {url}")
+            return ips
+
+        except requests.RequestException as e:
+            logger.error(f"Error downloading from {url}: {e}")
+            return []
+
     def download_data(self) -> List[str]:
         """
         Download Cloudflare IP ranges from text files.
 
+        The URLs are fetched concurrently; results keep the configured order.
+
         Returns:
             List of IP ranges (CIDR notation)
         """
         all_ips = []
 
-        for url in self.urls:
-            logger.info(f"Downloading from: {url}")
-            try:
-                response = requests.get(url, timeout=30)
-                response.raise_for_status()
-
-                # Parse text file (one IP per line)
-                lines = response.text.strip().split('\n')
-                for line in lines:
-                    ip = line.strip()
-                    if ip and is_valid_ip(ip):
-                        all_ips.append(ip)
-
-                logger.info(f"Downloaded {len(lines)} IPs from {url}")
-
-            except requests.RequestException as e:
-                logger.error(f"Error downloading from {url}: {e}")
+        with ThreadPoolExecutor(max_workers=len(self.urls) or 1) as executor:
+            for ips in executor.map(self._download_url, self.urls):
+                all_ips.extend(ips)
 
         return all_ips
 
@@ -94,12 +110,8 @@ class CloudflareIP:
 
         # Generate global files
         logger.info("Generating global files...")
-        all_combined = all_ipv4 + all_ipv6
         # Write global files with separation of single IPs and ranges
-        base_path = os.path.join(self.output_dir, "ips")
-        write_separated_ip_files(base_path, all_combined, "all")
-        write_separated_ip_files(base_path, all_ipv4, "ipv4")
-        write_separated_ip_files(base_path, all_ipv6, "ipv6")
+        write_all_splits(os.path.join(self.output_dir, "ips"), all_ipv4, all_ipv6)
 
         # Calculate detailed stats
         detailed_stats = calculate_detailed_stats(all_ips_list, all_ipv4, all_ipv6)
@@ -112,7 +124,7 @@ class CloudflareIP:
             ipv4_ranges=detailed_stats['ipv4_ranges'],
             ipv6_ranges=detailed_stats['ipv6_ranges'],
             ipv4_count=detailed_stats['ipv4_count'],
-            ipv6_count=calculate_total_ips(all_ipv6),
+            ipv6_count=detailed_stats['ipv6_count'],
             services=None,
             regions=None,
             ipv4_single=detailed_stats['ipv4_single'],
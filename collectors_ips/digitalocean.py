@@ -5,22 +5,24 @@ DigitalOcean IP Sync - Download DigitalOcean IP ranges and generate organized fi
 
 import os
 import sys
-import json
 import logging
 import requests
 import csv
-import io
+from collections import defaultdict
 
 from .ip_utils import (
     separate_ipv4_ipv6,
-    write_separated_ip_files,
     generate_index_markdown,
-    calculate_total_ips,
     print_summary,
     ensure_directory,
-    is_valid_ip,
-    sanitize_filename,
-    calculate_detailed_stats
+    filter_valid_ips,
+    write_bucket_files,
+    calculate_detailed_stats,
+    load_config,
+    get_session,
+    write_all_splits,
+    separate_single_ips_and_ranges,
+    write_packed_ipv4
 )
 
 logger = logging.getLogger(__name__)
@@ -29,9 +31,10 @@ logger = logging.getLogger(__name__)
 class DigitalOceanIP:
     """DigitalOcean IP ranges synchronization manager."""
 
+    __slots__ = ('url', 'output_dir', 'regions_dir')
+
     def __init__(self, config_path: str = "config.json"):
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = load_config(config_path)
         self.url = config['digitalocean']['url']
         self.output_dir = os.path.join("cloud_ips", "digitalocean")
         self.regions_dir = os.path.join(self.output_dir, "regions")
@@ -43,42 +46,59 @@ class DigitalOceanIP:
         Returns:
             Tuple of (all_ips, regions_ips)
             - all_ips: List of all IP ranges
-            - regions_ips: Dict mapping region names to IP sets
+            - regions_ips: Dict mapping region names to (IPv4 set, IPv6 set)
         """
         logger.info(f"Downloading from: {self.url}")
         all_ips = []
-        regions_ips = {}
+        regions_ips = defaultdict(lambda: (set(), set()))
 
         try:
-            response = requests.get(self.url, timeout=30)
+            response = get_session().get(self.url, timeout=30, stream=True)
             response.raise_for_status()
 
-            csv_data = csv.reader(io.StringIO(response.text))
+            # iter_lines() only decodes when an encoding is known
+            if response.encoding is None:
+                response.encoding = 'utf-8'
+
+            # Parallel arrays (IP, interned region name) built while streaming,
+            # so the CSV is never materialized as one big string
+            ips = []
+            region_keys = []
+            csv_data = csv.reader(response.iter_lines(decode_unicode=True))
             for row in csv_data:
                 if len(row) < 4:
                     continue
 
                 # CSV structure: IP, Country, Region, City, Postal Code
                 ip = row[0].strip()
-                country = row[1].strip() if len(row) > 1 else ""
-                # region_code = row[2].strip() if len(row) > 2 else ""
-                city = row[3].strip() if len(row) > 3 else ""
+                country = row[1].strip()
+                # region_code = row[2].strip()
+                city = row[3].strip()
 
-                if ip and is_valid_ip(ip):
-                    all_ips.append(ip)
+                # Use city as region identifier (more readable)
+                # Region name: "City, Country" (e.g., "Amsterdam, NL")
+                if city:
+                    region_name = sys.intern(f"{city}, {country}" if country else city)
+                else:
+                    region_name = None
 
-                    # Use city as region identifier (more readable)
-                    if city:
-                        # Create region name: "City, Country" (e.g., "Amsterdam, NL")
-                        region_name = f"{city}, {country}" if country else city
+                ips.append(ip)
+                region_keys.append(region_name)
 
-                        if region_name not in regions_ips:
-                            regions_ips[region_name] = set()
-                        regions_ips[region_name].add(ip)
+            # Validate all IPs in one bulk pass
+            valid_ips = set(filter_valid_ips(ips))
+
+            for ip, region_name in zip(ips, region_keys):
+                if ip not in valid_ips:
+                    continue
+                all_ips.append(ip)
+                if region_name:
+                    # Family index: 0 = IPv4, 1 = IPv6 (only IPv6 contains ':')
+                    regions_ips[region_name][':' in ip].add(ip)
 
             logger.info(f"Downloaded {len(all_ips)} IPs")
             logger.info(f"Found {len(regions_ips)} regions")
-            return all_ips, regions_ips
+            return all_ips, dict(regions_ips)
 
         except requests.RequestException as e:
             logger.error(f"Error: {e}")
@@ -98,35 +118,16 @@ class DigitalOceanIP:
 
         # Generate global files
         logger.info("Generating global files...")
-        all_combined = all_ipv4 + all_ipv6
         # Write global files with separation of single IPs and ranges
-        base_path = os.path.join(self.output_dir, "ips")
-        write_separated_ip_files(base_path, all_combined, "all")
-        write_separated_ip_files(base_path, all_ipv4, "ipv4")
-        write_separated_ip_files(base_path, all_ipv6, "ipv6")
+        write_all_splits(os.path.join(self.output_dir, "ips"), all_ipv4, all_ipv6)
 
-        # Generate per-region files
-        logger.info(f"Generating region files ({len(regions_ips)} regions)...")
-        region_counts = {}
-        for region_name, ips in regions_ips.items():
-            safe_name = sanitize_filename(region_name)
-            ips_list = list(ips)
-            ipv4, ipv6 = separate_ipv4_ipv6(ips_list)
+        # Packed binary copy of the single IPv4 addresses
+        ipv4_single, _ = separate_single_ips_and_ranges(all_ipv4)
+        write_packed_ipv4(os.path.join(self.output_dir, "ips_single_ipv4.bin"), ipv4_single)
 
-            # Write files with separation of single IPs and ranges
-            base_path = os.path.join(self.regions_dir, safe_name)
-            all_combined = ipv4 + ipv6
-            write_separated_ip_files(base_path, all_combined, "all")
-
-            # Write IPv4 if present
-            if ipv4:
-                write_separated_ip_files(base_path, ipv4, "ipv4")
-
-            # Write IPv6 if present
-            if ipv6:
-                write_separated_ip_files(base_path, ipv6, "ipv6")
-
-            region_counts[region_name] = len(ips)
+        # Generate per-region files (buckets arrive split by family; counts come back from the writer)
+        logger.info(f"Generating region files ({len(regions_ips)} regions)...")
+        region_counts = write_bucket_files(self.regions_dir, regions_ips, presplit=True)
 
         # Calculate detailed stats
         detailed_stats = calculate_detailed_stats(all_ips_list, all_ipv4, all_ipv6)
@@ -139,7 +140,7 @@ class DigitalOceanIP:
             ipv4_ranges=detailed_stats['ipv4_ranges'],
             ipv6_ranges=detailed_stats['ipv6_ranges'],
             ipv4_count=detailed_stats['ipv4_count'],
-            ipv6_count=calculate_total_ips(all_ipv6),
+            ipv6_count=detailed_stats['ipv6_count'],
             services=None,
             regions=region_counts,
             ipv4_single=detailed_stats['ipv4_single'],
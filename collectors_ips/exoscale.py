@@ -5,20 +5,21 @@ Exoscale IP Sync - Download Exoscale IP ranges and generate organized files.
 
 import os
 import sys
-import json
 import logging
 import requests
+from collections import defaultdict
 
 from .ip_utils import (
-    separate_ipv4_ipv6,
-    write_separated_ip_files,
     generate_index_markdown,
-    calculate_total_ips,
     print_summary,
     ensure_directory,
-    is_valid_ip,
-    sanitize_filename,
-    calculate_detailed_stats
+    filter_valid_ips,
+    calculate_detailed_stats,
+    write_all_splits,
+    write_bucket_files,
+    json_loads,
+    get_session,
+    load_config
 )
 
 logger = logging.getLogger(__name__)
@@ -28,8 +29,7 @@ class ExoscaleIP:
     """Exoscale IP ranges synchronization manager."""
 
     def __init__(self, config_path: str = "config.json"):
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = load_config(config_path)
         self.url = config['exoscale']['url']
         self.output_dir = os.path.join("cloud_ips", "exoscale")
         self.regions_dir = os.path.join(self.output_dir, "regions")
@@ -37,12 +37,12 @@ class ExoscaleIP:
     def download_data(self) -> dict:
         logger.info(f"Downloading from: {self.url}")
         try:
-            response = requests.get(self.url, timeout=30)
+            response = get_session().get(self.url, timeout=30)
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
             logger.info("Successfully downloaded JSON data")
             return data
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             logger.error(f"Error: {e}")
             return {}
 
@@ -50,82 +50,77 @@ class ExoscaleIP:
         """
         Extract IPs and regions from Exoscale JSON.
 
+        IPs are split by family while extracting, based on the prefix key.
+
         Returns:
-            Tuple of (all_ips, regions_ips)
+            Tuple of (all_ipv4, all_ipv6, regions_ips)
+            - regions_ips: Dict mapping zone names to (IPv4 set, IPv6 set)
         """
-        all_ips = []
-        regions_ips = {}
+        families = ([], [])
+        regions_ips = defaultdict(lambda: (set(), set()))
 
         # Exoscale JSON structure: { "prefixes": [ { "IPv4Prefix" or "IPv6Prefix", "zone" } ] }
         prefixes = data.get('prefixes', [])
 
+        # Get IPv4 or IPv6 prefix (the key gives the family) and zone,
+        # then validate the whole batch at once
+        get = dict.get
+        intern = sys.intern
+        entries = []
+        add_entry = entries.append
         for prefix in prefixes:
             if isinstance(prefix, dict):
-                # Get IPv4 or IPv6 prefix
-                ip = prefix.get('IPv4Prefix') or prefix.get('IPv6Prefix', '')
-                zone = prefix.get('zone', '')
-
-                if ip and is_valid_ip(ip):
-                    all_ips.append(ip)
-
-                    # Use zone as region identifier
-                    if zone:
-                        if zone not in regions_ips:
-                            regions_ips[zone] = set()
-                        regions_ips[zone].add(ip)
-
-        logger.info(f"Extracted {len(all_ips)} IPs from {len(prefixes)} prefixes")
+                ip = get(prefix, 'IPv4Prefix')
+                family = 0
+                if not ip:
+                    ip = get(prefix, 'IPv6Prefix', '')
+                    family = 1
+                # Zone names repeat across prefixes: intern them for the bucket
+                # lookups (only real strings: a null zone is simply skipped below)
+                zone = get(prefix, 'zone', '')
+                if isinstance(zone, str):
+                    zone = intern(zone)
+                add_entry((ip, family, zone))
+        valid = set(filter_valid_ips([ip for ip, _, _ in entries]))
+
+        region_bucket = regions_ips.__getitem__
+        for ip, family, zone in entries:
+            if ip in valid:
+                families[family].append(ip)
+
+                # Use zone as region identifier
+                if zone:
+                    region_bucket(zone)[family].add(ip)
+
+        all_ipv4, all_ipv6 = families
+        logger.info(f"Extracted {len(all_ipv4) + len(all_ipv6)} IPs from {len(prefixes)} prefixes")
         logger.info(f"Found {len(regions_ips)} regions/zones")
-        return all_ips, regions_ips
+        # Plain dict for callers: a stray lookup must not create an empty bucket
+        return all_ipv4, all_ipv6, dict(regions_ips)
 
     def generate_files(self) -> None:
         logger.info("\nStarting IP range extraction...")
-        ensure_directory(self.output_dir)
+        # Creating regions_dir also creates output_dir
         ensure_directory(self.regions_dir)
 
         data = self.download_data()
         if not data:
             return
 
-        all_ips_list, regions_ips = self.extract_ips(data)
+        all_ipv4, all_ipv6, regions_ips = self.extract_ips(data)
+        all_ips_list = all_ipv4 + all_ipv6
         if not all_ips_list:
             logger.info("Warning: No IP ranges found!")
             return
 
-        # Separate IPv4/IPv6 for global files
-        all_ipv4, all_ipv6 = separate_ipv4_ipv6(all_ips_list)
-
         # Generate global files
         logger.info("Generating global files...")
-        all_combined = all_ipv4 + all_ipv6
         # Write global files with separation of single IPs and ranges
-        base_path = os.path.join(self.output_dir, "ips")
-        write_separated_ip_files(base_path, all_combined, "all")
-        write_separated_ip_files(base_path, all_ipv4, "ipv4")
-        write_separated_ip_files(base_path, all_ipv6, "ipv6")
+        write_all_splits(os.path.join(self.output_dir, "ips"), all_ipv4, all_ipv6)
 
         # Generate per-region files
         logger.info(f"Generating region files ({len(regions_ips)} regions)...")
-        region_counts = {}
-        for region_name, ips in regions_ips.items():
-            safe_name = sanitize_filename(region_name)
-            ips_list = list(ips)
-            ipv4, ipv6 = separate_ipv4_ipv6(ips_list)
-
-            # Write files with separation of single IPs and ranges
-            base_path = os.path.join(self.regions_dir, safe_name)
-            all_combined = ipv4 + ipv6
-            write_separated_ip_files(base_path, all_combined, "all")
-
-            # Write IPv4 if present
-            if ipv4:
-                write_separated_ip_files(base_path, ipv4, "ipv4")
-
-            # Write IPv6 if present
-            if ipv6:
-                write_separated_ip_files(base_path, ipv6, "ipv6")
-
-            region_counts[region_name] = len(ips)
+        region_counts = write_bucket_files(self.regions_dir, regions_ips, presplit=True)
 
         # Calculate detailed stats
         detailed_stats = calculate_detailed_stats(all_ips_list, all_ipv4, all_ipv6)
@@ -138,7 +133,7 @@ class ExoscaleIP:
             ipv4_ranges=detailed_stats['ipv4_ranges'],
             ipv6_ranges=detailed_stats['ipv6_ranges'],
             ipv4_count=detailed_stats['ipv4_count'],
-            ipv6_count=calculate_total_ips(all_ipv6),
+            ipv6_count=detailed_stats['ipv6_count'],
             services=None,
             regions=region_counts,
             ipv4_single=detailed_stats['ipv4_single'],
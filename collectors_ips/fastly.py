@@ -7,21 +7,21 @@ Fastly provides a JSON API with IP addresses.
 
 import os
 import sys
-import json
 import logging
 import requests
 from typing import List
 
 # Import shared utilities
 from .ip_utils import (
-    separate_ipv4_ipv6,
-    write_separated_ip_files,
+    separate_ipv4_ipv6_with_stats,
     generate_index_markdown,
-    calculate_total_ips,
     print_summary,
     ensure_directory,
-    is_valid_ip,
-    calculate_detailed_stats
+    filter_valid_ips,
+    write_all_splits,
+    json_loads,
+    get_session,
+    load_config
 )
 
 logger = logging.getLogger(__name__)
@@ -37,8 +37,7 @@ class FastlyIP:
         Args:
             config_path: Path to configuration file
         """
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = load_config(config_path)
 
         self.url = config['fastly']['url']
         self.output_dir = os.path.join("cloud_ips", "fastly")
@@ -52,12 +51,12 @@ class FastlyIP:
         """
         logger.info(f"Downloading from: {self.url}")
         try:
-            response = requests.get(self.url, timeout=30)
+            response = get_session().get(self.url, timeout=30)
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
             logger.info("Successfully downloaded JSON data")
             return data
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             logger.error(f"Error downloading data: {e}")
             return {}
 
@@ -71,25 +70,16 @@ class FastlyIP:
         Returns:
             List of IP ranges
         """
-        all_ips = []
-
-        # Fastly API returns addresses in different fields
-        # Common fields: addresses, ipv4, ipv6
-        for key in ['addresses', 'ipv4', 'ipv6']:
-            if key in data and isinstance(data[key], list):
-                for ip in data[key]:
-                    if isinstance(ip, str) and is_valid_ip(ip):
-                        all_ips.append(ip)
-
-        # Also check nested structures
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if isinstance(value, list):
-                    for item in value:
-                        if isinstance(item, str) and is_valid_ip(item):
-                            all_ips.append(item)
-
-        return list(set(all_ips))  # Remove duplicates
+        # Fastly API returns addresses in different list fields
+        # (addresses, ipv4_addresses, ipv6_addresses, ...): scan each list once
+        candidates = []
+        for value in data.values():
+            if isinstance(value, list):
+                candidates.extend(value)
+
+        # Validate all candidates in one batch (non-strings are dropped),
+        # then remove duplicates preserving order
+        return list(dict.fromkeys(filter_valid_ips(candidates)))
 
     def generate_files(self) -> None:
         """
@@ -115,21 +105,14 @@ class FastlyIP:
             logger.info("Warning: No IP ranges found!")
             return
 
-        # Separate IPv4/IPv6
+        # Separate IPv4/IPv6 and calculate detailed stats in the same pass
         logger.info("Separating IPv4/IPv6...")
-        all_ipv4, all_ipv6 = separate_ipv4_ipv6(all_ips_list)
+        all_ipv4, all_ipv6, detailed_stats = separate_ipv4_ipv6_with_stats(all_ips_list)
 
         # Generate global files
         logger.info("Generating global files...")
-        all_combined = all_ipv4 + all_ipv6
         # Write global files with separation of single IPs and ranges
-        base_path = os.path.join(self.output_dir, "ips")
-        write_separated_ip_files(base_path, all_combined, "all")
-        write_separated_ip_files(base_path, all_ipv4, "ipv4")
-        write_separated_ip_files(base_path, all_ipv6, "ipv6")
-
-        # Calculate detailed stats
-        detailed_stats = calculate_detailed_stats(all_ips_list, all_ipv4, all_ipv6)
+        write_all_splits(os.path.join(self.output_dir, "ips"), all_ipv4, all_ipv6)
 
         # Generate index.md
         logger.info("Generating index.md...")
@@ -139,7 +122,7 @@ class FastlyIP:
             ipv4_ranges=detailed_stats['ipv4_ranges'],
             ipv6_ranges=detailed_stats['ipv6_ranges'],
             ipv4_count=detailed_stats['ipv4_count'],
-            ipv6_count=calculate_total_ips(all_ipv6),
+            ipv6_count=detailed_stats['ipv6_count'],
             services=None,
             regions=None,
             ipv4_single=detailed_stats['ipv4_single'],
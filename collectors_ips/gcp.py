@@ -8,19 +8,26 @@ IP range files organized by services and regions (scopes).
 
 import os
 import sys
-import json
 import logging
 import requests
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, Optional
 
 from .ip_utils import (
-    separate_ipv4_ipv6,
-    write_separated_ip_files,
+    separate_ipv4_ipv6_with_stats,
     generate_index_markdown,
-    calculate_total_ips,
-    sanitize_filename,
     print_summary,
     ensure_directory,
-    calculate_detailed_stats
+    write_all_splits,
+    write_bucket_files,
+    split_buckets_by_family,
+    json_loads,
+    read_response_body,
+    get_session,
+    iter_json_array,
+    JSON_STREAMING_AVAILABLE,
+    load_config
 )
 
 logger = logging.getLogger(__name__)
@@ -36,8 +43,7 @@ class GCPIP:
         Args:
             config_path: Path to configuration file
         """
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = load_config(config_path)
 
         self.url = config['gcp']['url']
         self.output_dir = os.path.join("cloud_ips", "gcp")
@@ -57,9 +63,9 @@ class GCPIP:
         """
         logger.info(f"Downloading from: {self.url}")
         try:
-            response = requests.get(self.url, timeout=60)
-            response.raise_for_status()
-            self.data = response.json()
+            with get_session().get(self.url, timeout=60, stream=True) as response:
+                response.raise_for_status()
+                self.data = json_loads(read_response_body(response))
             sync_token = self.data.get('syncToken', 'N/A')
             creation_time = self.data.get('creationTime', 'N/A')
             logger.info(f"Successfully downloaded (sync token: {sync_token}, time: {creation_time})")
@@ -68,47 +74,91 @@ class GCPIP:
             logger.error(f"Error downloading data: {e}")
             raise
 
-    def extract_ips(self) -> tuple:
+    def stream_prefixes(self) -> Iterator[dict]:
+        """
+        Stream GCP prefix entries while downloading (requires ijson).
+
+        The sync token and creation time are logged once the stream is consumed.
+
+        Yields:
+            Prefix entries as dicts
+
+        Raises:
+            requests.RequestException: If download fails
+        """
+        logger.info(f"Streaming from: {self.url}")
+        metadata = {}
+        try:
+            with get_session().get(self.url, timeout=60, stream=True) as response:
+                response.raise_for_status()
+                yield from iter_json_array(response, "prefixes", metadata)
+        except requests.RequestException as e:
+            logger.error(f"Error downloading data: {e}")
+            raise
+
+        sync_token = metadata.get('syncToken', 'N/A')
+        creation_time = metadata.get('creationTime', 'N/A')
+        logger.info(f"Successfully downloaded (sync token: {sync_token}, time: {creation_time})")
+
+    def extract_ips(self, prefixes: Optional[Iterable[dict]] = None) -> tuple:
         """
         Extract all IP ranges organized by service and region (scope).
 
+        Args:
+            prefixes: Prefix entries to process (default: self.data["prefixes"])
+
         Returns:
             Tuple of (services_ips, regions_ips, all_ips)
-            - services_ips: Dict mapping service names to IP sets
-            - regions_ips: Dict mapping region/scope names to IP sets
+            - services_ips: Dict mapping service names to (IPv4 set, IPv6 set)
+            - regions_ips: Dict mapping region/scope names to (IPv4 set, IPv6 set)
             - all_ips: Set of all IP ranges
         """
-        if not self.data:
-            raise ValueError("Data not loaded. Call download_data() first.")
+        if prefixes is None:
+            if not self.data:
+                raise ValueError("Data not loaded. Call download_data() first.")
+            prefixes = self.data.get("prefixes", [])
 
-        services_ips = {}
-        regions_ips = {}
+        services_ips = defaultdict(lambda: (set(), set()))
+        regions_ips = defaultdict(lambda: (set(), set()))
         all_ips = set()
 
-        # Process prefixes (both IPv4 and IPv6 in same array)
-        for prefix in self.data.get("prefixes", []):
-            # Get IP prefix (could be ipv4Prefix or ipv6Prefix)
-            ip_prefix = prefix.get("ipv4Prefix") or prefix.get("ipv6Prefix")
-            service = prefix.get("service", "UNKNOWN")
-            scope = prefix.get("scope", "global")  # scope is like region
+        # Bind hot lookups locally: the loop runs once per prefix
+        get = dict.get
+        intern = sys.intern
+        service_bucket = services_ips.__getitem__
+        region_bucket = regions_ips.__getitem__
+        all_add = all_ips.add
 
+        # Process prefixes (both IPv4 and IPv6 in same array)
+        for prefix in prefixes:
+            # Get IP prefix (could be ipv4Prefix or ipv6Prefix), the key gives the family
+            ip_prefix = get(prefix, "ipv4Prefix")
+            family = 0
             if not ip_prefix:
-                continue
-
-            # Add to services
-            if service not in services_ips:
-                services_ips[service] = set()
-            services_ips[service].add(ip_prefix)
-
-            # Add to regions (scopes)
-            if scope not in regions_ips:
-                regions_ips[scope] = set()
-            regions_ips[scope].add(ip_prefix)
+                ip_prefix = get(prefix, "ipv6Prefix")
+                family = 1
+                if not ip_prefix:
+                    continue
+
+            # Bucket names repeat across thousands of prefixes: intern them so
+            # every bucket lookup hashes and compares one shared string object
+            # (only real strings: intern() rejects a JSON null)
+            service = get(prefix, "service", "UNKNOWN")
+            if isinstance(service, str):
+                service = intern(service)
+            scope = get(prefix, "scope", "global")  # scope is like region
+            if isinstance(scope, str):
+                scope = intern(scope)
+
+            # Add to services and regions (scopes)
+            service_bucket(service)[family].add(ip_prefix)
+            region_bucket(scope)[family].add(ip_prefix)
 
             # Add to all IPs
-            all_ips.add(ip_prefix)
+            all_add(ip_prefix)
 
-        return services_ips, regions_ips, all_ips
+        # Plain dicts for callers: a stray lookup must not create an empty bucket
+        return dict(services_ips), dict(regions_ips), all_ips
 
     def generate_files(self) -> None:
         """
@@ -116,81 +166,55 @@ class GCPIP:
         """
         logger.info("\nStarting IP range extraction...")
 
-        # Download data if not already loaded
+        # Stream prefixes off the response when ijson is available,
+        # otherwise download the whole document if not already loaded
+        prefixes = None
         if not self.data:
-            self.download_data()
+            if JSON_STREAMING_AVAILABLE:
+                prefixes = self.stream_prefixes()
+            else:
+                self.download_data()
 
-        # Create directories
-        ensure_directory(self.output_dir)
+        # Create directories (output_dir is created as their parent)
         ensure_directory(self.services_dir)
         ensure_directory(self.regions_dir)
 
         # Extract IPs by service and region
         logger.info("Extracting IPs by service and scope...")
-        services_ips, regions_ips, all_ips = self.extract_ips()
+        services_ips, regions_ips, all_ips = self.extract_ips(prefixes)
 
-        # Convert sets to lists and separate IPv4/IPv6
+        # Separate IPv4/IPv6 for global files and calculate detailed stats in the
+        # same pass (also validates the feed; service and scope buckets are
+        # already split by family and only need checking against it)
         logger.info("Separating IPv4/IPv6...")
-        all_ips_list = list(all_ips)
-        all_ipv4, all_ipv6 = separate_ipv4_ipv6(all_ips_list)
+        all_ipv4, all_ipv6, detailed_stats = separate_ipv4_ipv6_with_stats(all_ips)
 
-        # Generate global files
+        # Global, per-service and per-region files are independent: write them concurrently
         logger.info("Generating global files...")
-        all_combined = all_ipv4 + all_ipv6
-        # Write global files with separation of single IPs and ranges
-        base_path = os.path.join(self.output_dir, "ips")
-        write_separated_ip_files(base_path, all_combined, "all")
-        write_separated_ip_files(base_path, all_ipv4, "ipv4")
-        write_separated_ip_files(base_path, all_ipv6, "ipv6")
-
-        # Generate per-service files
         logger.info(f"Generating service files ({len(services_ips)} services)...")
-        service_counts = {}
-        for service_name, ips in services_ips.items():
-            safe_name = sanitize_filename(service_name)
-            ips_list = list(ips)
-            ipv4, ipv6 = separate_ipv4_ipv6(ips_list)
-
-            # Write files with separation of single IPs and ranges
-            base_path = os.path.join(self.services_dir, safe_name)
-            all_combined = ipv4 + ipv6
-            write_separated_ip_files(base_path, all_combined, "all")
-
-            # Write IPv4 if present
-            if ipv4:
-                write_separated_ip_files(base_path, ipv4, "ipv4")
-
-            # Write IPv6 if present
-            if ipv6:
-                write_separated_ip_files(base_path, ipv6, "ipv6")
-
-            service_counts[service_name] = len(ips)
-
-        # Generate per-region files (scopes)
         logger.info(f"Generating region/scope files ({len(regions_ips)} scopes)...")
-        region_counts = {}
-        for region_name, ips in regions_ips.items():
-            safe_name = sanitize_filename(region_name)
-            ips_list = list(ips)
-            ipv4, ipv6 = separate_ipv4_ipv6(ips_list)
-
-            # Write files with separation of single IPs and ranges
-            base_path = os.path.join(self.regions_dir, safe_name)
-            all_combined = ipv4 + ipv6
-            write_separated_ip_files(base_path, all_combined, "all")
-
-            # Write IPv4 if present
-            if ipv4:
-                write_separated_ip_files(base_path, ipv4, "ipv4")
-
-            # Write IPv6 if present
-            if ipv6:
-                write_separated_ip_files(base_path, ipv6, "ipv6")
-
-            region_counts[region_name] = len(ips)
-
-        # Calculate detailed stats
-        detailed_stats = calculate_detailed_stats(all_ips, all_ipv4, all_ipv6)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            # Write global files with separation of single IPs and ranges
+            global_files = executor.submit(
+                write_all_splits, os.path.join(self.output_dir, "ips"), all_ipv4, all_ipv6
+            )
+            # Keep only validated ranges in the buckets, like the global files
+            service_files = executor.submit(
+                write_bucket_files,
+                self.services_dir,
+                split_buckets_by_family(services_ips, all_ipv4, all_ipv6),
+                presplit=True
+            )
+            region_files = executor.submit(
+                write_bucket_files,
+                self.regions_dir,
+                split_buckets_by_family(regions_ips, all_ipv4, all_ipv6),
+                presplit=True
+            )
+
+            global_files.result()
+            service_counts = service_files.result()
+            region_counts = region_files.result()
 
         # Generate index.md
         logger.info("Generating index.md...")
@@ -200,7 +224,7 @@ class GCPIP:
             ipv4_ranges=detailed_stats['ipv4_ranges'],
             ipv6_ranges=detailed_stats['ipv6_ranges'],
             ipv4_count=detailed_stats['ipv4_count'],
-            ipv6_count=calculate_total_ips(all_ipv6),
+            ipv6_count=detailed_stats['ipv6_count'],
             services=service_counts,
             regions=region_counts,
             ipv4_single=detailed_stats['ipv4_single'],
@@ -17,20 +17,22 @@ GitHub provides a meta API endpoint with IP ranges for various services:
 
 import os
 import sys
-import json
 import logging
 import requests
+from itertools import chain
 
 from .ip_utils import (
     separate_ipv4_ipv6,
     write_separated_ip_files,
     generate_index_markdown,
-    calculate_total_ips,
     print_summary,
     ensure_directory,
     is_valid_ip,
     sanitize_filename,
-    calculate_detailed_stats
+    calculate_detailed_stats,
+    write_all_splits,
+    load_config,
+    json_loads
 )
 
 logger = logging.getLogger(__name__)
@@ -55,8 +57,7 @@ class GitHubIP:
     """GitHub IP ranges synchronization manager."""
 
     def __init__(self, config_path: str = "config.json"):
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = load_config(config_path)
         self.url = config['github']['url']
         self.output_dir = os.path.join("cloud_ips", "github")
         self.services_dir = os.path.join(self.output_dir, "services")
@@ -75,7 +76,7 @@ class GitHubIP:
         try:
             response = requests.get(self.url, timeout=30)
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
 
             # Extract IPs from each service
             for service in GITHUB_SERVICES:
@@ -91,7 +92,7 @@ class GitHubIP:
 
             logger.info(f"Total: {len(all_ips)} IPs from {len(services_ips)} services")
 
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             logger.error(f"Error downloading from {self.url}: {e}")
 
         return all_ips, services_ips
@@ -112,11 +113,8 @@ class GitHubIP:
 
         # Generate global files
         logger.info("Generating global files...")
-        all_combined = all_ipv4 + all_ipv6
-        base_path = os.path.join(self.output_dir, "ips")
-        write_separated_ip_files(base_path, all_combined, "all")
-        write_separated_ip_files(base_path, all_ipv4, "ipv4")
-        write_separated_ip_files(base_path, all_ipv6, "ipv6")
+        # Write global files with separation of single IPs and ranges
+        write_all_splits(os.path.join(self.output_dir, "ips"), all_ipv4, all_ipv6)
 
         # Generate per-service files
         logger.info(f"Generating service files ({len(services_ips)} services)...")
@@ -127,8 +125,7 @@ class GitHubIP:
             ipv4, ipv6 = separate_ipv4_ipv6(ips_list)
 
             base_path = os.path.join(self.services_dir, safe_name)
-            all_combined = ipv4 + ipv6
-            write_separated_ip_files(base_path, all_combined, "all")
+            write_separated_ip_files(base_path, chain(ipv4, ipv6), "all")
 
             if ipv4:
                 write_separated_ip_files(base_path, ipv4, "ipv4")
@@ -149,7 +146,7 @@ class GitHubIP:
             ipv4_ranges=detailed_stats['ipv4_ranges'],
             ipv6_ranges=detailed_stats['ipv6_ranges'],
             ipv4_count=detailed_stats['ipv4_count'],
-            ipv6_count=calculate_total_ips(all_ipv6),
+            ipv6_count=detailed_stats['ipv6_count'],
             services=service_counts,
             regions=None,
             ipv4_single=detailed_stats['ipv4_single'],
@@ -7,19 +7,19 @@ Googlebot provides a JSON file with IPv4 and IPv6 prefixes used by Google's craw
 
 import os
 import sys
-import json
 import logging
 import requests
 
 from .ip_utils import (
-    separate_ipv4_ipv6,
-    write_separated_ip_files,
+    separate_ipv4_ipv6_with_stats,
     generate_index_markdown,
-    calculate_total_ips,
     print_summary,
     ensure_directory,
-    is_valid_ip,
-    calculate_detailed_stats
+    filter_valid_ips,
+    write_all_splits,
+    json_loads,
+    get_session,
+    load_config
 )
 
 logger = logging.getLogger(__name__)
@@ -29,20 +29,19 @@ class GooglebotIP:
     """Googlebot IP ranges synchronization manager."""
 
     def __init__(self, config_path: str = "config.json"):
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = load_config(config_path)
         self.url = config['googlebot']['url']
         self.output_dir = os.path.join("cloud_ips", "googlebot")
 
     def download_data(self) -> dict:
         logger.info(f"Downloading from: {self.url}")
         try:
-            response = requests.get(self.url, timeout=30)
+            response = get_session().get(self.url, timeout=30)
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
             logger.info("Successfully downloaded JSON data")
             return data
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             logger.error(f"Error: {e}")
             return {}
 
@@ -53,18 +52,15 @@ class GooglebotIP:
         Returns:
             List of all IPs
         """
-        all_ips = []
-
         # Googlebot JSON structure: { "prefixes": [ { "ipv4Prefix" or "ipv6Prefix" } ] }
         prefixes = data.get('prefixes', [])
 
-        for prefix in prefixes:
-            if isinstance(prefix, dict):
-                # Get IPv4 or IPv6 prefix
-                ip = prefix.get('ipv4Prefix') or prefix.get('ipv6Prefix', '')
-
-                if ip and is_valid_ip(ip):
-                    all_ips.append(ip)
+        # Get IPv4 or IPv6 prefix, then validate the whole batch at once
+        get = dict.get
+        all_ips = filter_valid_ips([
+            get(prefix, 'ipv4Prefix') or get(prefix, 'ipv6Prefix', '')
+            for prefix in prefixes if isinstance(prefix, dict)
+        ])
 
         logger.info(f"Extracted {len(all_ips)} IPs from {len(prefixes)} prefixes")
         return all_ips
@@ -82,20 +78,14 @@ class GooglebotIP:
             logger.info("Warning: No IP ranges found!")
             return
 
-        # Separate IPv4/IPv6
+        # Separate IPv4/IPv6 and calculate detailed stats in the same pass
         logger.info("Separating IPv4/IPv6...")
-        all_ipv4, all_ipv6 = separate_ipv4_ipv6(all_ips_list)
+        all_ipv4, all_ipv6, detailed_stats = separate_ipv4_ipv6_with_stats(all_ips_list)
 
         # Generate global files
         logger.info("Generating global files...")
-        all_combined = all_ipv4 + all_ipv6
-        base_path = os.path.join(self.output_dir, "ips")
-        write_separated_ip_files(base_path, all_combined, "all")
-        write_separated_ip_files(base_path, all_ipv4, "ipv4")
-        write_separated_ip_files(base_path, all_ipv6, "ipv6")
-
-        # Calculate detailed stats
-        detailed_stats = calculate_detailed_stats(all_ips_list, all_ipv4, all_ipv6)
+        # Write global files with separation of single IPs and ranges
+        write_all_splits(os.path.join(self.output_dir, "ips"), all_ipv4, all_ipv6)
 
         # Generate index.md
         logger.info("Generating index.md...")
@@ -105,7 +95,7 @@ class GooglebotIP:
             ipv4_ranges=detailed_stats['ipv4_ranges'],
             ipv6_ranges=detailed_stats['ipv6_ranges'],
             ipv4_count=detailed_stats['ipv4_count'],
-            ipv6_count=calculate_total_ips(all_ipv6),
+            ipv6_count=detailed_stats['ipv6_count'],
             services=None,
             regions=None,
             ipv4_single=detailed_stats['ipv4_single'],
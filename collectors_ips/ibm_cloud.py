@@ -7,39 +7,96 @@ IBM Cloud provides IP ranges in HTML documentation organized by services.
 
 import os
 import sys
-import json
 import logging
 import requests
 import re
+from html import unescape
+from typing import Dict, Optional, Set
 
 logger = logging.getLogger(__name__)
 
+# BeautifulSoup is only needed as a fallback when the raw HTML scan finds nothing
 try:
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, NavigableString, Tag
+    BS4_AVAILABLE = True
 except ImportError:
-    logger.info("Error: BeautifulSoup4 is required. Install with: pip install beautifulsoup4")
-    sys.exit(1)
+    BS4_AVAILABLE = False
+
+# Prefer the C-based lxml tree builder, fall back to the pure-Python parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
 
 from .ip_utils import (
-    separate_ipv4_ipv6,
-    write_separated_ip_files,
+    separate_ipv4_ipv6_with_stats,
     generate_index_markdown,
-    calculate_total_ips,
     print_summary,
     ensure_directory,
-    is_valid_ip,
-    sanitize_filename,
-    is_private_ip,
-    calculate_detailed_stats
+    is_public_ip,
+    write_all_splits,
+    write_bucket_files,
+    load_config,
+    get_session
 )
 
+# Patterns for IP addresses (IPv4, IPv6), compiled once
+_IPV4_PATTERN = re.compile(r'(?:[0-9]{1,3}\.){3}[0-9]{1,3}(?:/[0-9]{1,2})?')
+_IPV6_PATTERN = re.compile(r'(?:[0-9a-fA-F]{1,4}:){3,7}[0-9a-fA-F]{1,4}(?:/[0-9]{1,3})?')
+_IP_PATTERNS = (_IPV4_PATTERN, _IPV6_PATTERN)
+
+# Raw HTML scanning: blocks whose text is not page content, start/end tags
+# (closing slash, name) and any tag
+_NON_CONTENT_RE = re.compile(r'<(script|style|svg|noscript)\b.*?</\1\s*>|<!--.*?-->', re.S | re.I)
+_TAG_TOKEN_RE = re.compile(r'<(/?)([a-zA-Z][^\s/>]*)[^>]*>')
+_TAG_RE = re.compile(r'<[^>]*>')
+
+# Elements without a closing tag (html.parser keeps them empty)
+_VOID_TAGS = frozenset({
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta',
+    'param', 'source', 'track', 'wbr'
+})
+
+# Service sections to extract
+SERVICE_HEADERS = [
+    'Front-end (public) network',
+    'Load balancer IPs',
+    'Back-end (private) network',
+    'Customer private network space',
+    'Service network (on back-end/private network)',
+    'SSL VPN network (on back-end/private network)',
+    'SSL VPN data centers',
+    'Legacy networks',
+    'Red Hat Enterprise Linux server requirements',
+    'Windows virtual server instance requirements'
+]
+
+# Lowercased header texts: exact dict lookup first, substring match as fallback
+_HEADER_LOOKUP = {header_text.lower(): header_text for header_text in SERVICE_HEADERS}
+
+
+def _match_service(header: str) -> Optional[str]:
+    """
+    Map a page header to the service section it names.
+
+    Args:
+        header: Header text (stripped, lowercased)
+
+    Returns:
+        Service name, or None if the header opens no tracked section
+    """
+    service_name = _HEADER_LOOKUP.get(header)
+    if service_name is None:
+        service_name = next((name for key, name in _HEADER_LOOKUP.items() if key in header), None)
+    return service_name
+
 
 class IBMCloudIP:
     """IBM Cloud IP ranges synchronization manager."""
 
     def __init__(self, config_path: str = "config.json"):
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = load_config(config_path)
         self.url = config['ibm_cloud']['url']
         self.output_dir = os.path.join("cloud_ips", "ibm_cloud")
         self.services_dir = os.path.join(self.output_dir, "services")
@@ -47,7 +104,7 @@ class IBMCloudIP:
     def download_data(self) -> str:
         logger.info(f"Downloading from: {self.url}")
         try:
-            response = requests.get(self.url, timeout=30)
+            response = get_session().get(self.url, timeout=30)
             response.raise_for_status()
             logger.info(f"Downloaded HTML ({len(response.text)} bytes)")
             return response.text
@@ -59,95 +116,161 @@ class IBMCloudIP:
         """
         Extract IPs from HTML organized by services.
 
+        The raw HTML is scanned with regexes; BeautifulSoup is only used (when
+        installed) if that scan finds no IPs, e.g. after a page layout change.
+
         Returns:
             Tuple of (all_ips, services_ips)
             - all_ips: List of all IPs
             - services_ips: Dict mapping service names to IP sets
         """
-        all_ips = []
-        services_ips = {}
-        soup = BeautifulSoup(html, 'html.parser')
-
-        # Patterns for IP addresses
-        ipv4_pattern = re.compile(r'(?:[0-9]{1,3}\.){3}[0-9]{1,3}(?:/[0-9]{1,2})?')
-        ipv6_pattern = re.compile(r'(?:[0-9a-fA-F]{1,4}:){3,7}[0-9a-fA-F]{1,4}(?:/[0-9]{1,3})?')
-
-        # Define the service sections to extract
-        service_headers = [
-            'Front-end (public) network',
-            'Load balancer IPs',
-            'Back-end (private) network',
-            'Customer private network space',
-            'Service network (on back-end/private network)',
-            'SSL VPN network (on back-end/private network)',
-            'SSL VPN data centers',
-            'Legacy networks',
-            'Red Hat Enterprise Linux server requirements',
-            'Windows virtual server instance requirements'
-        ]
-
-        # Find all h2/h3 headers and extract IPs in their sections
-        for header_text in service_headers:
-            # Find the header
-            header = soup.find(['h2', 'h3'], string=re.compile(re.escape(header_text), re.IGNORECASE))
-
-            if not header:
-                continue
+        all_ips = set()
+        services_ips = self._scan_html(html, all_ips)
 
-            service_name = header_text
-            logger.info(f"Processing section: {service_name}")
+        if not all_ips and BS4_AVAILABLE:
+            logger.info("No IPs found by the HTML scan, falling back to BeautifulSoup...")
+            services_ips = self._walk_soup(html, all_ips)
 
-            # Get all content until the next header of same or higher level
-            current_element = header.find_next_sibling()
-            section_ips = set()
+        # Keep only sections where IPs were found
+        services_ips = {name: ips for name, ips in services_ips.items() if ips}
+        for name, ips in services_ips.items():
+            logger.info(f"  Found {len(ips)} IPs in {name}")
 
-            while current_element:
-                # Stop if we hit another h2 or h3
-                if current_element.name in ['h2', 'h3']:
-                    break
+        all_ips = list(all_ips)
 
-                # Extract IPs from this element
-                text = current_element.get_text()
+        logger.info(f"Total unique IPs: {len(all_ips)}")
+        logger.info(f"Services found: {len(services_ips)}")
 
-                # Find IPv4
-                for ip in ipv4_pattern.findall(text):
-                    if is_valid_ip(ip) and not is_private_ip(ip):
-                        section_ips.add(ip)
-                        all_ips.append(ip)
+        return all_ips, services_ips
 
-                # Find IPv6
-                for ip in ipv6_pattern.findall(text):
-                    if is_valid_ip(ip) and not is_private_ip(ip):
-                        section_ips.add(ip)
-                        all_ips.append(ip)
+    def _scan_html(self, html: str, all_ips: Set[str]) -> Dict[str, Set[str]]:
+        """
+        Attribute IPs to sections by scanning the raw HTML, without a DOM.
 
-                # Also check in code blocks and pre tags
-                for code_elem in current_element.find_all(['code', 'pre']):
-                    code_text = code_elem.get_text()
+        Tags are matched in one pass while a stack of open elements is kept,
+        so a section covers the elements following its header under the same
+        parent, up to the next h2/h3 sibling or the parent's closing tag (like
+        walking the header's siblings). Matches inside tag markup (attribute
+        values) are ignored, as a text walk would.
 
-                    for ip in ipv4_pattern.findall(code_text):
-                        if is_valid_ip(ip) and not is_private_ip(ip):
-                            section_ips.add(ip)
-                            all_ips.append(ip)
+        Args:
+            html: Page HTML
+            all_ips: Set receiving every accepted IP
 
-                    for ip in ipv6_pattern.findall(code_text):
-                        if is_valid_ip(ip) and not is_private_ip(ip):
-                            section_ips.add(ip)
-                            all_ips.append(ip)
+        Returns:
+            Dict mapping service names to IP sets
+        """
+        content = _NON_CONTENT_RE.sub('', html)
+        services_ips = {}
 
-                current_element = current_element.find_next_sibling()
+        # Open elements as [tag name, sections opened by its child headers,
+        # header text start (h2/h3 only)]; the document root is never closed
+        stack = [[None, [], None]]
+        active = 0
+
+        def close(element: list, end: int) -> None:
+            nonlocal active
+            active -= len(element[1])
+            if element[2] is None:
+                return
+            header = unescape(_TAG_RE.sub('', content[element[2]:end])).strip().lower()
+            service_name = _match_service(header)
+            # Only the first header naming a service opens its section
+            if service_name is not None and service_name not in services_ips:
+                logger.info(f"Processing section: {service_name}")
+                services_ips[service_name] = set()
+                stack[-1][1].append(service_name)
+                active += 1
+
+        def scan(start: int, end: int) -> None:
+            # Text directly under a header's parent is not in any sibling element
+            targets = [name for element in stack[:-1] for name in element[1]]
+            if not targets:
+                return
+            for pattern in _IP_PATTERNS:
+                for match in pattern.finditer(content, start, end):
+                    ip = match.group()
+                    # IPs repeat across the page: only unseen ones need checking
+                    if ip in all_ips or is_public_ip(ip):
+                        all_ips.add(ip)
+                        for name in targets:
+                            services_ips[name].add(ip)
+
+        pos = 0
+        for tag in _TAG_TOKEN_RE.finditer(content):
+            if active and tag.start() > pos:
+                scan(pos, tag.start())
+            pos = tag.end()
+            name = tag.group(2).lower()
+
+            if tag.group(1):
+                # Close up to the most recent matching element, ignore stray end tags
+                for index in range(len(stack) - 1, 0, -1):
+                    if stack[index][0] == name:
+                        while len(stack) > index:
+                            close(stack.pop(), tag.start())
+                        break
+                continue
 
-            if section_ips:
-                services_ips[service_name] = section_ips
-                logger.info(f"  Found {len(section_ips)} IPs in {service_name}")
+            is_header = name in ('h2', 'h3')
+            if is_header:
+                # A sibling header ends the sections opened under this parent
+                active -= len(stack[-1][1])
+                stack[-1][1] = []
+            if name not in _VOID_TAGS and not tag.group().endswith('/>'):
+                stack.append([name, [], pos if is_header else None])
 
-        # Remove duplicates from all_ips
-        all_ips = list(set(all_ips))
+        if active and pos < len(content):
+            scan(pos, len(content))
 
-        logger.info(f"Total unique IPs: {len(all_ips)}")
-        logger.info(f"Services found: {len(services_ips)}")
+        return services_ips
 
-        return all_ips, services_ips
+    def _walk_soup(self, html: str, all_ips: Set[str]) -> Dict[str, Set[str]]:
+        """
+        Attribute IPs to sections by walking the BeautifulSoup tree.
+
+        Args:
+            html: Page HTML
+            all_ips: Set receiving every accepted IP
+
+        Returns:
+            Dict mapping service names to IP sets
+        """
+        soup = BeautifulSoup(html, HTML_PARSER)
+        services_ips = {}
+
+        # A section is made of the elements following its header under the same
+        # parent, up to the next h2/h3 sibling; only the first header naming a
+        # service opens it
+        for header in soup.find_all(['h2', 'h3']):
+            service_name = _match_service(header.get_text().strip().lower())
+            if service_name is None or service_name in services_ips:
+                continue
+            logger.info(f"Processing section: {service_name}")
+            section_ips = services_ips[service_name] = set()
+
+            for sibling in header.next_siblings:
+                if not isinstance(sibling, Tag):
+                    continue
+                if sibling.name in ('h2', 'h3'):
+                    break
+
+                # Every text node is visited once, <code>/<pre> included
+                for node in sibling.descendants:
+                    # Plain text only (skips comments, scripts and styles, like get_text())
+                    if type(node) is not NavigableString:
+                        continue
+
+                    # Find IPv4 and IPv6
+                    for pattern in _IP_PATTERNS:
+                        for match in pattern.finditer(node):
+                            ip = match.group()
+                            # IPs repeat across the page: only unseen ones need checking
+                            if ip in all_ips or is_public_ip(ip):
+                                section_ips.add(ip)
+                                all_ips.add(ip)
+
+        return services_ips
 
     def generate_files(self) -> None:
         logger.info("\nStarting IP range extraction...")
@@ -165,42 +288,17 @@ class IBMCloudIP:
             logger.info("Warning: No IP ranges found!")
             return
 
-        # Separate IPv4/IPv6 for global files
-        all_ipv4, all_ipv6 = separate_ipv4_ipv6(all_ips_list)
+        # Separate IPv4/IPv6 and compute stats in a single pass
+        all_ipv4, all_ipv6, detailed_stats = separate_ipv4_ipv6_with_stats(all_ips_list)
 
         # Generate global files
         logger.info("Generating global files...")
-        all_combined = all_ipv4 + all_ipv6
-        base_path = os.path.join(self.output_dir, "ips")
-        write_separated_ip_files(base_path, all_combined, "all")
-        write_separated_ip_files(base_path, all_ipv4, "ipv4")
-        write_separated_ip_files(base_path, all_ipv6, "ipv6")
+        # Write global files with separation of single IPs and ranges
+        write_all_splits(os.path.join(self.output_dir, "ips"), all_ipv4, all_ipv6)
 
         # Generate per-service files
         logger.info(f"Generating service files ({len(services_ips)} services)...")
-        service_counts = {}
-        for service_name, ips in services_ips.items():
-            safe_name = sanitize_filename(service_name)
-            ips_list = list(ips)
-            ipv4, ipv6 = separate_ipv4_ipv6(ips_list)
-
-            # Write files with separation of single IPs and ranges
-            base_path = os.path.join(self.services_dir, safe_name)
-            all_combined = ipv4 + ipv6
-            write_separated_ip_files(base_path, all_combined, "all")
-
-            # Write IPv4 if present
-            if ipv4:
-                write_separated_ip_files(base_path, ipv4, "ipv4")
-
-            # Write IPv6 if present
-            if ipv6:
-                write_separated_ip_files(base_path, ipv6, "ipv6")
-
-            service_counts[service_name] = len(ips)
-
-        # Calculate detailed stats
-        detailed_stats = calculate_detailed_stats(all_ips_list, all_ipv4, all_ipv6)
+        service_counts = write_bucket_files(self.services_dir, services_ips)
 
         # Generate index.md
         logger.info("Generating index.md...")
@@ -210,7 +308,7 @@ class IBMCloudIP:
             ipv4_ranges=detailed_stats['ipv4_ranges'],
             ipv6_ranges=detailed_stats['ipv6_ranges'],
             ipv4_count=detailed_stats['ipv4_count'],
-            ipv6_count=calculate_total_ips(all_ipv6),
+            ipv6_count=detailed_stats['ipv6_count'],
             services=service_counts,
             regions=None,
             ipv4_single=detailed_stats['ipv4_single'],
@@ -7,23 +7,24 @@ Linode provides IP ranges in CSV format.
 
 import os
 import sys
-import json
 import logging
 import requests
 import csv
 import io
+from itertools import chain
 
 # Import shared utilities
 from .ip_utils import (
     separate_ipv4_ipv6,
     write_separated_ip_files,
     generate_index_markdown,
-    calculate_total_ips,
     print_summary,
     ensure_directory,
     is_valid_ip,
     sanitize_filename,
-    calculate_detailed_stats
+    calculate_detailed_stats,
+    write_all_splits,
+    load_config
 )
 
 logger = logging.getLogger(__name__)
@@ -34,8 +35,7 @@ class LinodeIP:
 
     def __init__(self, config_path: str = "config.json"):
         """Initialize the Linode IP manager."""
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = load_config(config_path)
 
         self.url = config['linode']['url']
         self.output_dir = os.path.join("cloud_ips", "linode")
@@ -111,12 +111,8 @@ class LinodeIP:
 
         # Generate global files
         logger.info("Generating global files...")
-        all_combined = all_ipv4 + all_ipv6
         # Write global files with separation of single IPs and ranges
-        base_path = os.path.join(self.output_dir, "ips")
-        write_separated_ip_files(base_path, all_combined, "all")
-        write_separated_ip_files(base_path, all_ipv4, "ipv4")
-        write_separated_ip_files(base_path, all_ipv6, "ipv6")
+        write_all_splits(os.path.join(self.output_dir, "ips"), all_ipv4, all_ipv6)
 
         # Generate per-region files
         logger.info(f"Generating region files ({len(regions_ips)} regions)...")
@@ -128,8 +124,7 @@ class LinodeIP:
 
             # Write files with separation of single IPs and ranges
             base_path = os.path.join(self.regions_dir, safe_name)
-            all_combined = ipv4 + ipv6
-            write_separated_ip_files(base_path, all_combined, "all")
+            write_separated_ip_files(base_path, chain(ipv4, ipv6), "all")
 
             # Write IPv4 if present
             if ipv4:
@@ -152,7 +147,7 @@ class LinodeIP:
             ipv4_ranges=detailed_stats['ipv4_ranges'],
             ipv6_ranges=detailed_stats['ipv6_ranges'],
             ipv4_count=detailed_stats['ipv4_count'],
-            ipv6_count=calculate_total_ips(all_ipv6),
+            ipv6_count=detailed_stats['ipv6_count'],
             services=None,
             regions=region_counts,
             ipv4_single=detailed_stats['ipv4_single'],
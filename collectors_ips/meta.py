@@ -8,20 +8,20 @@ Format: IP,Country,Region,City,
 
 import os
 import sys
-import json
+import csv
 import logging
 import requests
 
 from .ip_utils import (
-    separate_ipv4_ipv6,
-    write_separated_ip_files,
+    separate_ipv4_ipv6_with_stats,
     generate_index_markdown,
-    calculate_total_ips,
     print_summary,
     ensure_directory,
     is_valid_ip,
-    sanitize_filename,
-    calculate_detailed_stats
+    write_all_splits,
+    write_bucket_files,
+    load_config,
+    get_session
 )
 
 logger = logging.getLogger(__name__)
@@ -31,8 +31,7 @@ class MetaIP:
     """Meta IP ranges synchronization manager."""
 
     def __init__(self, config_path: str = "config.json"):
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = load_config(config_path)
         self.url = config['meta']['url']
         self.output_dir = os.path.join("cloud_ips", "meta")
         self.regions_dir = os.path.join(self.output_dir, "regions")
@@ -49,18 +48,20 @@ class MetaIP:
         regions_ips = {}
 
         try:
-            response = requests.get(self.url, timeout=30)
-            response.raise_for_status()
-
-            for line in response.text.splitlines():
-                line = line.strip()
-                # Skip comments and empty lines
-                if not line or line.startswith('#'):
-                    continue
+            # Stream the geofeed row by row instead of holding the whole body
+            # as one string and then a list of lines
+            with get_session().get(self.url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                # iter_lines() only decodes when an encoding is known
+                if response.encoding is None:
+                    response.encoding = 'utf-8'
 
                 # Parse CSV: IP,Country,Region,City,
-                parts = line.split(',')
-                if len(parts) >= 1:
+                for parts in csv.reader(response.iter_lines(decode_unicode=True)):
+                    # Skip comments and empty lines
+                    if not parts or parts[0].lstrip().startswith('#'):
+                        continue
+
                     ip = parts[0].strip()
                     country = parts[1].strip() if len(parts) > 1 else ''
                     city = parts[3].strip() if len(parts) > 3 else ''
@@ -96,40 +97,18 @@ class MetaIP:
             logger.info("Warning: No IP ranges found!")
             return
 
-        # Separate IPv4/IPv6
+        # Separate IPv4/IPv6 and compute stats in a single pass
         logger.info("Separating IPv4/IPv6...")
-        all_ipv4, all_ipv6 = separate_ipv4_ipv6(all_ips_list)
+        all_ipv4, all_ipv6, detailed_stats = separate_ipv4_ipv6_with_stats(all_ips_list)
 
         # Generate global files
         logger.info("Generating global files...")
-        all_combined = all_ipv4 + all_ipv6
-        base_path = os.path.join(self.output_dir, "ips")
-        write_separated_ip_files(base_path, all_combined, "all")
-        write_separated_ip_files(base_path, all_ipv4, "ipv4")
-        write_separated_ip_files(base_path, all_ipv6, "ipv6")
+        # Write global files with separation of single IPs and ranges
+        write_all_splits(os.path.join(self.output_dir, "ips"), all_ipv4, all_ipv6)
 
         # Generate per-region files
         logger.info(f"Generating region files ({len(regions_ips)} regions)...")
-        region_counts = {}
-        for region_name, ips in regions_ips.items():
-            safe_name = sanitize_filename(region_name)
-            ips_list = list(ips)
-            ipv4, ipv6 = separate_ipv4_ipv6(ips_list)
-
-            base_path = os.path.join(self.regions_dir, safe_name)
-            all_combined = ipv4 + ipv6
-            write_separated_ip_files(base_path, all_combined, "all")
-
-            if ipv4:
-                write_separated_ip_files(base_path, ipv4, "ipv4")
-
-            if ipv6:
-                write_separated_ip_files(base_path, ipv6, "ipv6")
-
-            region_counts[region_name] = len(ips)
-
-        # Calculate detailed stats
-        detailed_stats = calculate_detailed_stats(all_ips_list, all_ipv4, all_ipv6)
+        region_counts = write_bucket_files(self.regions_dir, regions_ips)
 
         # Generate index.md
         logger.info("Generating index.md...")
@@ -139,7 +118,7 @@ class MetaIP:
             ipv4_ranges=detailed_stats['ipv4_ranges'],
             ipv6_ranges=detailed_stats['ipv6_ranges'],
             ipv4_count=detailed_stats['ipv4_count'],
-            ipv6_count=calculate_total_ips(all_ipv6),
+            ipv6_count=detailed_stats['ipv6_count'],
             services=None,
             regions=region_counts,
             ipv4_single=detailed_stats['ipv4_single'],
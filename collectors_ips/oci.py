@@ -8,20 +8,28 @@ IP range files organized by services (tags) and regions.
 
 import os
 import sys
-import json
 import logging
 import requests
+from collections import defaultdict
+from typing import Iterable, Iterator, Optional
 
 # Import shared utilities
 from .ip_utils import (
-    separate_ipv4_ipv6,
-    write_separated_ip_files,
+    separate_ipv4_ipv6_with_stats,
+    split_buckets_by_family,
     generate_index_markdown,
-    calculate_total_ips,
-    sanitize_filename,
     print_summary,
     ensure_directory,
-    calculate_detailed_stats
+    write_all_splits,
+    write_bucket_files,
+    write_bytes_atomic,
+    write_packed_ipv4_ranges,
+    load_config,
+    json_loads,
+    read_response_body,
+    get_session,
+    iter_json_array,
+    JSON_STREAMING_AVAILABLE
 )
 
 logger = logging.getLogger(__name__)
@@ -37,8 +45,7 @@ class OCIIP:
         Args:
             config_path: Path to configuration file
         """
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = load_config(config_path)
 
         self.url = config['oci']['url']
         self.output_dir = os.path.join("cloud_ips", "oci")
@@ -58,66 +65,94 @@ class OCIIP:
         """
         logger.info(f"Downloading from: {self.url}")
         try:
-            response = requests.get(self.url, timeout=60)
-            response.raise_for_status()
-            self.data = response.json()
+            with get_session().get(self.url, timeout=60, stream=True) as response:
+                response.raise_for_status()
+                self.data = json_loads(read_response_body(response))
             last_updated = self.data.get('last_updated_timestamp', 'N/A')
             logger.info(f"Successfully downloaded (last updated: {last_updated})")
             return self.data
+        except (requests.RequestException, ValueError) as e:
+            logger.error(f"Error downloading data: {e}")
+            raise
+
+    def stream_regions(self) -> Iterator[dict]:
+        """
+        Stream OCI region entries while downloading (requires ijson).
+
+        The last updated timestamp is logged once the stream is consumed.
+
+        Yields:
+            Region entries as dicts
+
+        Raises:
+            requests.RequestException: If download fails
+        """
+        logger.info(f"Streaming from: {self.url}")
+        metadata = {}
+        try:
+            with get_session().get(self.url, timeout=60, stream=True) as response:
+                response.raise_for_status()
+                yield from iter_json_array(response, "regions", metadata)
         except requests.RequestException as e:
             logger.error(f"Error downloading data: {e}")
             raise
 
-    def extract_ips(self) -> tuple:
+        last_updated = metadata.get('last_updated_timestamp', 'N/A')
+        logger.info(f"Successfully downloaded (last updated: {last_updated})")
+
+    def extract_ips(self, regions: Optional[Iterable[dict]] = None) -> tuple:
         """
         Extract all IP ranges organized by service (tags) and region.
 
+        Args:
+            regions: Region entries to process (default: self.data["regions"])
+
         Returns:
             Tuple of (services_ips, regions_ips, all_ips)
             - services_ips: Dict mapping service/tag names to IP sets
             - regions_ips: Dict mapping region names to IP sets
             - all_ips: Set of all IP ranges
         """
-        if not self.data:
-            raise ValueError("Data not loaded. Call download_data() first.")
+        if regions is None:
+            if not self.data:
+                raise ValueError("Data not loaded. Call download_data() first.")
+            regions = self.data.get("regions", [])
 
-        services_ips = {}
-        regions_ips = {}
+        services_ips = defaultdict(set)
+        regions_ips = defaultdict(set)
         all_ips = set()
 
+        # Bind hot lookups locally: the inner loop runs once per CIDR
+        get = dict.get
+        intern = sys.intern
+        service_bucket = services_ips.__getitem__
+        region_bucket = regions_ips.__getitem__
+        all_add = all_ips.add
+
         # Process regions
-        for region_data in self.data.get("regions", []):
-            region_name = region_data.get("region", "UNKNOWN")
+        for region_data in regions:
+            region_name = intern(get(region_data, "region", "UNKNOWN"))
 
             # Process CIDRs for this region
-            for cidr_data in region_data.get("cidrs", []):
-                cidr = cidr_data.get("cidr")
-                tags = cidr_data.get("tags", [])
-
+            for cidr_data in get(region_data, "cidrs", []):
+                cidr = get(cidr_data, "cidr")
                 if not cidr:
                     continue
 
                 # Add to regions
-                if region_name not in regions_ips:
-                    regions_ips[region_name] = set()
-                regions_ips[region_name].add(cidr)
-
-                # Add to services (tags)
-                if tags:
-                    for tag in tags:
-                        if tag not in services_ips:
-                            services_ips[tag] = set()
-                        services_ips[tag].add(cidr)
-                else:
-                    # No tags, add to "UNTAGGED" service
-                    if "UNTAGGED" not in services_ips:
-                        services_ips["UNTAGGED"] = set()
-                    services_ips["UNTAGGED"].add(cidr)
+                region_bucket(region_name).add(cidr)
+
+                # Add to services (tags), "UNTAGGED" when there are none
+                # Tag names repeat across thousands of CIDRs: intern them so
+                # every bucket lookup hashes and compares one shared string object
+                for tag in get(cidr_data, "tags") or ("UNTAGGED",):
+                    service_bucket(intern(tag)).add(cidr)
 
                 # Add to all IPs
-                all_ips.add(cidr)
+                all_add(cidr)
 
-        return services_ips, regions_ips, all_ips
+        # Plain dicts for callers: a stray lookup must not create an empty bucket
+        return dict(services_ips), dict(regions_ips), all_ips
 
     def generate_files(self) -> None:
         """
@@ -125,9 +160,14 @@ class OCIIP:
         """
         logger.info("\nStarting IP range extraction...")
 
-        # Download data if not already loaded
+        # Stream regions off the response when ijson is available,
+        # otherwise download the whole document if not already loaded
+        regions = None
         if not self.data:
-            self.download_data()
+            if JSON_STREAMING_AVAILABLE:
+                regions = self.stream_regions()
+            else:
+                self.download_data()
 
         # Create directories
         ensure_directory(self.output_dir)
@@ -136,70 +176,33 @@ class OCIIP:
 
         # Extract IPs by service and region
         logger.info("Extracting IPs by service (tags) and region...")
-        services_ips, regions_ips, all_ips = self.extract_ips()
+        services_ips, regions_ips, all_ips = self.extract_ips(regions)
 
-        # Convert sets to lists and separate IPv4/IPv6
+        # Separate IPv4/IPv6 straight from the set and calculate detailed
+        # stats in the same pass (also validates the ranges)
         logger.info("Separating IPv4/IPv6...")
-        all_ips_list = list(all_ips)
-        all_ipv4, all_ipv6 = separate_ipv4_ipv6(all_ips_list)
+        all_ipv4, all_ipv6, detailed_stats = separate_ipv4_ipv6_with_stats(all_ips)
 
         # Generate global files
         logger.info("Generating global files...")
-        all_combined = all_ipv4 + all_ipv6
         # Write global files with separation of single IPs and ranges
-        base_path = os.path.join(self.output_dir, "ips")
-        write_separated_ip_files(base_path, all_combined, "all")
-        write_separated_ip_files(base_path, all_ipv4, "ipv4")
-        write_separated_ip_files(base_path, all_ipv6, "ipv6")
+        write_all_splits(os.path.join(self.output_dir, "ips"), all_ipv4, all_ipv6)
+        # Packed copy of the IPv4 ranges for readers doing prefix lookups
+        write_packed_ipv4_ranges(
+            os.path.join(self.output_dir, "ips_ranges_ipv4.bin"), [ip for ip in all_ipv4 if '/' in ip]
+        )
 
         # Generate per-service files (tags)
         logger.info(f"Generating service files ({len(services_ips)} tags)...")
-        service_counts = {}
-        for service_name, ips in services_ips.items():
-            safe_name = sanitize_filename(service_name)
-            ips_list = list(ips)
-            ipv4, ipv6 = separate_ipv4_ipv6(ips_list)
-
-            # Write files with separation of single IPs and ranges
-            base_path = os.path.join(self.services_dir, safe_name)
-            all_combined = ipv4 + ipv6
-            write_separated_ip_files(base_path, all_combined, "all")
-
-            # Write IPv4 if present
-            if ipv4:
-                write_separated_ip_files(base_path, ipv4, "ipv4")
-
-            # Write IPv6 if present
-            if ipv6:
-                write_separated_ip_files(base_path, ipv6, "ipv6")
-
-            service_counts[service_name] = len(ips)
+        service_counts = write_bucket_files(
+            self.services_dir, split_buckets_by_family(services_ips, all_ipv4, all_ipv6), presplit=True
+        )
 
         # Generate per-region files
         logger.info(f"Generating region files ({len(regions_ips)} regions)...")
-        region_counts = {}
-        for region_name, ips in regions_ips.items():
-            safe_name = sanitize_filename(region_name)
-            ips_list = list(ips)
-            ipv4, ipv6 = separate_ipv4_ipv6(ips_list)
-
-            # Write files with separation of single IPs and ranges
-            base_path = os.path.join(self.regions_dir, safe_name)
-            all_combined = ipv4 + ipv6
-            write_separated_ip_files(base_path, all_combined, "all")
-
-            # Write IPv4 if present
-            if ipv4:
-                write_separated_ip_files(base_path, ipv4, "ipv4")
-
-            # Write IPv6 if present
-            if ipv6:
-                write_separated_ip_files(base_path, ipv6, "ipv6")
-
-            region_counts[region_name] = len(ips)
-
-        # Calculate detailed stats
-        detailed_stats = calculate_detailed_stats(all_ips, all_ipv4, all_ipv6)
+        region_counts = write_bucket_files(
+            self.regions_dir, split_buckets_by_family(regions_ips, all_ipv4, all_ipv6), presplit=True
+        )
 
         # Generate index.md
         logger.info("Generating index.md...")
@@ -209,7 +212,7 @@ class OCIIP:
             ipv4_ranges=detailed_stats['ipv4_ranges'],
             ipv6_ranges=detailed_stats['ipv6_ranges'],
             ipv4_count=detailed_stats['ipv4_count'],
-            ipv6_count=calculate_total_ips(all_ipv6),
+            ipv6_count=detailed_stats['ipv6_count'],
             services=service_counts,
             regions=region_counts,
             ipv4_single=detailed_stats['ipv4_single'],
@@ -218,8 +221,8 @@ class OCIIP:
             ipv6_ranges_only=detailed_stats['ipv6_ranges_only']
         )
 
-        with open(os.path.join(self.output_dir, "index.md"), 'w', encoding='utf-8') as f:
-            f.write(index_content)
+        # Encoded once and written in a single call, replaced atomically
+        write_bytes_atomic(os.path.join(self.output_dir, "index.md"), index_content.encode('utf-8'))
 
         # Print summary
         stats = {
@@ -9,20 +9,22 @@ OpenAI provides two JSON files:
 
 import os
 import sys
-import json
 import logging
 import requests
+from itertools import chain
 
 from .ip_utils import (
     separate_ipv4_ipv6,
     write_separated_ip_files,
     generate_index_markdown,
-    calculate_total_ips,
     print_summary,
     ensure_directory,
     is_valid_ip,
     sanitize_filename,
-    calculate_detailed_stats
+    calculate_detailed_stats,
+    write_all_splits,
+    load_config,
+    json_loads
 )
 
 logger = logging.getLogger(__name__)
@@ -32,8 +34,7 @@ class OpenAIIP:
     """OpenAI IP ranges synchronization manager."""
 
     def __init__(self, config_path: str = "config.json"):
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = load_config(config_path)
         self.urls = config['openai']['urls']
         self.output_dir = os.path.join("cloud_ips", "openai")
         self.services_dir = os.path.join(self.output_dir, "services")
@@ -59,7 +60,7 @@ class OpenAIIP:
             try:
                 response = requests.get(url, timeout=30)
                 response.raise_for_status()
-                data = response.json()
+                data = json_loads(response.content)
 
                 # Determine service name from URL
                 service_name = 'unknown'
@@ -82,7 +83,7 @@ class OpenAIIP:
 
                 logger.info(f"Downloaded {len(prefixes)} prefixes from {service_name}")
 
-            except requests.RequestException as e:
+            except (requests.RequestException, ValueError) as e:
                 logger.error(f"Error downloading from {url}: {e}")
 
         logger.info(f"Total: {len(all_ips)} IPs from {len(services_ips)} services")
@@ -104,11 +105,8 @@ class OpenAIIP:
 
         # Generate global files
         logger.info("Generating global files...")
-        all_combined = all_ipv4 + all_ipv6
-        base_path = os.path.join(self.output_dir, "ips")
-        write_separated_ip_files(base_path, all_combined, "all")
-        write_separated_ip_files(base_path, all_ipv4, "ipv4")
-        write_separated_ip_files(base_path, all_ipv6, "ipv6")
+        # Write global files with separation of single IPs and ranges
+        write_all_splits(os.path.join(self.output_dir, "ips"), all_ipv4, all_ipv6)
 
         # Generate per-service files
         logger.info(f"Generating service files ({len(services_ips)} services)...")
@@ -119,8 +117,7 @@ class OpenAIIP:
             ipv4, ipv6 = separate_ipv4_ipv6(ips_list)
 
             base_path = os.path.join(self.services_dir, safe_name)
-            all_combined = ipv4 + ipv6
-            write_separated_ip_files(base_path, all_combined, "all")
+            write_separated_ip_files(base_path, chain(ipv4, ipv6), "all")
 
             if ipv4:
                 write_separated_ip_files(base_path, ipv4, "ipv4")
@@ -141,7 +138,7 @@ class OpenAIIP:
             ipv4_ranges=detailed_stats['ipv4_ranges'],
             ipv6_ranges=detailed_stats['ipv6_ranges'],
             ipv4_count=detailed_stats['ipv4_count'],
-            ipv6_count=calculate_total_ips(all_ipv6),
+            ipv6_count=detailed_stats['ipv6_count'],
             services=service_counts,
             regions=None,
             ipv4_single=detailed_stats['ipv4_single'],
@@ -8,39 +8,104 @@ IP range information organized by regions.
 
 import os
 import sys
-import json
 import re
 import requests
 import logging
-
-logger = logging.getLogger(__name__)
-
-try:
-    from bs4 import BeautifulSoup
-except ImportError:
-    logger.info("Error: BeautifulSoup4 is required for HTML parsing.")
-    logger.info("Install with: pip install beautifulsoup4")
-    sys.exit(1)
+from html.parser import HTMLParser
+from typing import List
 
 from .ip_utils import (
-    separate_ipv4_ipv6,
-    write_separated_ip_files,
+    separate_ipv4_ipv6_with_stats,
+    split_buckets_by_family,
     generate_index_markdown,
-    calculate_total_ips,
-    sanitize_filename,
     print_summary,
     ensure_directory,
-    is_valid_ip,
-    calculate_detailed_stats
+    filter_valid_ips,
+    write_all_splits,
+    write_bucket_files,
+    write_bytes_atomic,
+    write_packed_ipv4_ranges,
+    load_config,
+    get_session,
+    read_response_body
 )
 
+logger = logging.getLogger(__name__)
+
+# Pattern to match CIDR IP ranges, compiled once
+_CIDR_PATTERN = re.compile(r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}/[0-9]{1,2}\b')
+
+# Whole <table> elements (non-nested) and table start tags in raw HTML
+_TABLE_RE = re.compile(r'<table\b.*?</table\s*>', re.S | re.I)
+_TABLE_OPEN_RE = re.compile(r'<table\b', re.I)
+
+
+class _TableRowParser(HTMLParser):
+    """
+    Collect the cell texts of every table row, without building a tree.
+
+    Each row becomes a list with one string per <td>/<th> cell: the cell's
+    text pieces, stripped and concatenated (like BeautifulSoup's
+    get_text(strip=True)). Omitted </td>, </th> and </tr> end tags are
+    handled, and script/style contents are ignored.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows: List[List[str]] = []
+        self._table_depth = 0
+        self._skip_depth = 0
+        self._row = None
+        self._cell = None
+
+    def _end_cell(self) -> None:
+        if self._cell is not None:
+            self._row.append(''.join(self._cell))
+            self._cell = None
+
+    def _end_row(self) -> None:
+        if self._row is not None:
+            self._end_cell()
+            self.rows.append(self._row)
+            self._row = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ('script', 'style'):
+            self._skip_depth += 1
+        elif tag == 'table':
+            self._table_depth += 1
+        elif not self._table_depth:
+            return
+        elif tag == 'tr':
+            self._end_row()
+            self._row = []
+        elif tag in ('td', 'th') and self._row is not None:
+            self._end_cell()
+            self._cell = []
+
+    def handle_endtag(self, tag):
+        if tag in ('script', 'style'):
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag == 'table':
+            self._end_row()
+            self._table_depth = max(0, self._table_depth - 1)
+        elif tag == 'tr':
+            self._end_row()
+        elif tag in ('td', 'th') and self._row is not None:
+            self._end_cell()
+
+    def handle_data(self, data):
+        if self._cell is not None and not self._skip_depth:
+            data = data.strip()
+            if data:
+                self._cell.append(data)
+
 
 class OutscaleIP:
     """Outscale IP ranges synchronization manager."""
 
     def __init__(self, config_path: str = "config.json"):
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = load_config(config_path)
 
         self.url = config['outscale']['url']
         self.output_dir = os.path.join("cloud_ips", "outscale")
@@ -50,9 +115,10 @@ class OutscaleIP:
     def download_data(self) -> str:
         logger.info(f"Downloading from: {self.url}")
         try:
-            response = requests.get(self.url, timeout=60)
-            response.raise_for_status()
-            self.html_content = response.text
+            with get_session().get(self.url, timeout=60, stream=True) as response:
+                response.raise_for_status()
+                # Decode the accumulated body once, with the charset response.text would use
+                self.html_content = read_response_body(response).decode(response.encoding or 'utf-8', 'replace')
             logger.info(f"Successfully downloaded HTML content ({len(self.html_content)} bytes)")
             return self.html_content
         except requests.RequestException as e:
@@ -71,45 +137,46 @@ class OutscaleIP:
         if not self.html_content:
             raise ValueError("HTML content not loaded. Call download_data() first.")
 
-        soup = BeautifulSoup(self.html_content, 'html.parser')
         regions_ips = {}
         all_ips = set()
 
-        # Pattern to match CIDR IP ranges
-        ip_pattern = re.compile(r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}/[0-9]{1,2}\b')
-
-        # Find all tables in the page
-        tables = soup.find_all('table')
-
-        for table in tables:
-            rows = table.find_all('tr')
-
-            for row in rows:
-                cells = row.find_all(['td', 'th'])
-                if len(cells) >= 2:
-                    # First cell is region, second cell contains IP ranges
-                    region_cell = cells[0].get_text(strip=True)
-                    ip_cell = cells[1].get_text(strip=True)
-
-                    # Skip header rows
-                    if 'Region' in region_cell or 'Public IP' in region_cell:
-                        continue
-
-                    # Extract region name (clean it up)
-                    region_name = region_cell.strip()
-                    if not region_name:
-                        continue
-
-                    # Extract all IPs from the IP cell
-                    found_ips = ip_pattern.findall(ip_cell)
-
-                    for ip in found_ips:
-                        if is_valid_ip(ip):
-                            all_ips.add(ip)
-
-                            if region_name not in regions_ips:
-                                regions_ips[region_name] = set()
-                            regions_ips[region_name].add(ip)
+        # No CIDR anywhere on the page: skip parsing it
+        if not _CIDR_PATTERN.search(self.html_content):
+            logger.info("No IP ranges found in HTML content")
+            return regions_ips, all_ips
+
+        # Only tables whose markup holds a CIDR go through the row parser;
+        # nested tables cannot be cut out by regex, so then parse the whole page
+        html = self.html_content
+        tables = _TABLE_RE.findall(html)
+        if any(_TABLE_OPEN_RE.search(table, 1) for table in tables):
+            fragments = (html,)
+        else:
+            fragments = [table for table in tables if _CIDR_PATTERN.search(table)]
+
+        parser = _TableRowParser()
+        for fragment in fragments:
+            parser.feed(fragment)
+        parser.close()
+        find_cidrs = _CIDR_PATTERN.findall
+
+        for cells in parser.rows:
+            if len(cells) < 2:
+                continue
+
+            # First cell is region (cell texts come out stripped), second cell contains IP ranges
+            region_name = cells[0]
+            ip_cell = cells[1]
+
+            # Skip header rows and rows without a region
+            if not region_name or 'Region' in region_name or 'Public IP' in region_name:
+                continue
+
+            # Validate the cell's IPs in one call, then add them in bulk
+            found_ips = filter_valid_ips(find_cidrs(ip_cell))
+            if found_ips:
+                all_ips.update(found_ips)
+                regions_ips.setdefault(region_name, set()).update(found_ips)
 
         logger.info(f"Extracted {len(all_ips)} IPs from {len(regions_ips)} regions")
         return regions_ips, all_ips
@@ -134,41 +201,25 @@ class OutscaleIP:
             logger.info("The page structure may have changed. Manual review needed.")
             return
 
-        # Convert sets to lists and separate IPv4/IPv6
+        # Separate IPv4/IPv6 straight from the set and calculate detailed
+        # stats in the same pass (also validates the ranges)
         logger.info("Separating IPv4/IPv6...")
-        all_ips_list = list(all_ips)
-        all_ipv4, all_ipv6 = separate_ipv4_ipv6(all_ips_list)
+        all_ipv4, all_ipv6, detailed_stats = separate_ipv4_ipv6_with_stats(all_ips)
 
         # Generate global files
         logger.info("Generating global files...")
-        all_combined = all_ipv4 + all_ipv6
-        base_path = os.path.join(self.output_dir, "ips")
-        write_separated_ip_files(base_path, all_combined, "all")
-        write_separated_ip_files(base_path, all_ipv4, "ipv4")
-        write_separated_ip_files(base_path, all_ipv6, "ipv6")
+        # Write global files with separation of single IPs and ranges
+        write_all_splits(os.path.join(self.output_dir, "ips"), all_ipv4, all_ipv6)
+        # Packed copy of the IPv4 ranges for readers doing prefix lookups
+        write_packed_ipv4_ranges(
+            os.path.join(self.output_dir, "ips_ranges_ipv4.bin"), [ip for ip in all_ipv4 if '/' in ip]
+        )
 
         # Generate per-region files
         logger.info(f"Generating region files ({len(regions_ips)} regions)...")
-        region_counts = {}
-        for region_name, ips in regions_ips.items():
-            safe_name = sanitize_filename(region_name)
-            ips_list = list(ips)
-            ipv4, ipv6 = separate_ipv4_ipv6(ips_list)
-
-            base_path = os.path.join(self.regions_dir, safe_name)
-            all_combined = ipv4 + ipv6
-            write_separated_ip_files(base_path, all_combined, "all")
-
-            if ipv4:
-                write_separated_ip_files(base_path, ipv4, "ipv4")
-
-            if ipv6:
-                write_separated_ip_files(base_path, ipv6, "ipv6")
-
-            region_counts[region_name] = len(ips)
-
-        # Calculate detailed stats
-        detailed_stats = calculate_detailed_stats(all_ips_list, all_ipv4, all_ipv6)
+        region_counts = write_bucket_files(
+            self.regions_dir, split_buckets_by_family(regions_ips, all_ipv4, all_ipv6), presplit=True
+        )
 
         # Generate index.md
         logger.info("Generating index.md...")
@@ -178,7 +229,7 @@ class OutscaleIP:
             ipv4_ranges=detailed_stats['ipv4_ranges'],
             ipv6_ranges=detailed_stats['ipv6_ranges'],
             ipv4_count=detailed_stats['ipv4_count'],
-            ipv6_count=calculate_total_ips(all_ipv6),
+            ipv6_count=detailed_stats['ipv6_count'],
             services=None,
             regions=region_counts,
             ipv4_single=detailed_stats['ipv4_single'],
@@ -187,8 +238,8 @@ class OutscaleIP:
             ipv6_ranges_only=detailed_stats['ipv6_ranges_only']
         )
 
-        with open(os.path.join(self.output_dir, "index.md"), 'w', encoding='utf-8') as f:
-            f.write(index_content)
+        # Encoded once and written in a single call, replaced atomically
+        write_bytes_atomic(os.path.join(self.output_dir, "index.md"), index_content.encode('utf-8'))
 
         stats = {
             **detailed_stats,
@@ -8,20 +8,22 @@ and extract IP range information organized by clusters.
 
 import os
 import sys
-import json
+import atexit
+import multiprocessing.util
 import re
-import time
 import requests
 import logging
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
 
 logger = logging.getLogger(__name__)
 
 try:
-    from bs4 import BeautifulSoup
-except ImportError:
-    logger.info("Error: BeautifulSoup4 is required for HTML parsing.")
-    logger.info("Install with: pip install beautifulsoup4")
-    sys.exit(1)
+    from lxml import etree, html as lxml_html
+except ImportError as e:
+    # Raised rather than exiting so that only this provider fails
+    raise ImportError("lxml is required for HTML parsing. Install with: pip install lxml") from e
 
 try:
     from selenium import webdriver
@@ -29,6 +31,7 @@ try:
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
     from selenium.webdriver.chrome.options import Options as ChromeOptions
+    from selenium.webdriver.chrome.service import Service as ChromeService
     SELENIUM_AVAILABLE = True
 except ImportError:
     SELENIUM_AVAILABLE = False
@@ -36,14 +39,92 @@ except ImportError:
 
 from .ip_utils import (
     separate_ipv4_ipv6,
+    split_buckets_by_family,
     write_separated_ip_files,
     generate_index_markdown,
-    calculate_total_ips,
     print_summary,
     ensure_directory,
-    is_valid_ip,
-    calculate_detailed_stats
+    get_session,
+    filter_valid_ips,
+    calculate_detailed_stats,
+    write_all_splits,
+    load_config,
+    json_loads
+)
+
+# IP addresses (relaxed boundaries to handle "Copy" button text)
+_IPV4_RE = re.compile(r'(?:[0-9]{1,3}\.){3}[0-9]{1,3}')
+_IPV6_RE = re.compile(r'(?:[0-9a-fA-F]{1,4}:){3,7}[0-9a-fA-F]{1,4}')
+# Country codes (2 uppercase letters)
+_COUNTRY_RE = re.compile(r'\b([A-Z]{2})\b')
+_CLUSTER_HDR_RE = re.compile(r'Cluster\s+(\d+)', re.IGNORECASE)
+
+# XPath queries for the cluster walk, compiled once (evaluated by libxml2)
+_CLUSTER_HEADERS_XPATH = etree.XPath(
+    "//h3[re:test(string(.), 'Cluster\\s+\\d+', 'i')]",
+    namespaces={'re': 'http://exslt.org/regular-expressions'}
 )
+_NEXT_TABLE_XPATH = etree.XPath("following::table[1]")
+_NEXT_SIBLING_XPATH = etree.XPath("following-sibling::*[1]")
+
+
+def _next_sibling(element):
+    """Next sibling element (comments and text skipped), or None."""
+    siblings = _NEXT_SIBLING_XPATH(element)
+    return siblings[0] if siblings else None
+
+
+def _ipv4_candidates(text: str) -> List[str]:
+    """IPv4 regex matches in text, skipping the regex when text has no '.' at all."""
+    return _IPV4_RE.findall(text) if '.' in text else []
+
+
+# Headless Chrome shared by every scrape in the process (browser startup takes seconds)
+_shared_driver = None
+
+
+def _get_driver():
+    """
+    Return the shared headless Chrome driver, starting it on first use.
+
+    Returns:
+        selenium.webdriver.Chrome instance, quit automatically at (worker) exit
+    """
+    global _shared_driver
+
+    if _shared_driver is None:
+        # Setup Chrome options
+        chrome_options = ChromeOptions()
+        chrome_options.add_argument('--headless')  # Run in background
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument('--disable-extensions')
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')  # Only text is needed
+        chrome_options.add_argument('--window-size=1920,1080')
+        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+
+        _shared_driver = webdriver.Chrome(service=ChromeService(), options=chrome_options)
+        # Pool worker processes exit without running atexit handlers, but they
+        # do run multiprocessing finalizers: quit the browser from there too
+        multiprocessing.util.Finalize(None, _quit_driver, exitpriority=0)
+
+    return _shared_driver
+
+
+def _quit_driver() -> None:
+    """Quit the shared Chrome driver if it is running."""
+    global _shared_driver
+
+    if _shared_driver is not None:
+        driver, _shared_driver = _shared_driver, None
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"Error quitting Chrome driver: {e}")
+
+
+atexit.register(_quit_driver)
 
 
 class OVHIP:
@@ -58,8 +139,7 @@ class OVHIP:
             data_file: Path to OVH data JSON file (fallback if scraping fails)
             use_selenium: Whether to use Selenium for scraping (default: True)
         """
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = load_config(config_path)
 
         self.url = config['ovh']['url']
         self.output_dir = os.path.join("cloud_ips", "ovh")
@@ -83,19 +163,9 @@ class OVHIP:
         """
         logger.info(f"Scraping with Selenium from: {self.url}")
 
-        # Setup Chrome options
-        chrome_options = ChromeOptions()
-        chrome_options.add_argument('--headless')  # Run in background
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-
-        driver = None
         try:
-            # Initialize Chrome driver
-            driver = webdriver.Chrome(options=chrome_options)
+            # Reuse the process-wide Chrome driver
+            driver = _get_driver()
 
             # Load page
             logger.info("Loading page...")
@@ -112,23 +182,34 @@ class OVHIP:
             except Exception as e:
                 logger.info(f"Warning: Timeout waiting for content: {e}")
 
-            # Additional wait to ensure all content is rendered
-            time.sleep(3)
+            # Wait until the number of cluster headers stops growing (unchanged
+            # across two polls 500ms apart) instead of a fixed sleep
+            last_count = [-1]
+
+            def clusters_stable(d):
+                count = len(d.find_elements(By.XPATH, "//h3[contains(., 'Cluster')]"))
+                stable = count > 0 and count == last_count[0]
+                last_count[0] = count
+                return stable
+
+            try:
+                WebDriverWait(driver, 10, poll_frequency=0.5).until(clusters_stable)
+            except Exception as e:
+                logger.info(f"Warning: Cluster list still changing: {e}")
 
-            # Get rendered HTML
-            html_content = driver.page_source
+            # Get rendered HTML: one script call returning the serialized DOM is
+            # cheaper than page_source's WebDriver marshaling
+            html_content = driver.execute_script("return document.documentElement.outerHTML") or driver.page_source
             logger.info(f"Successfully scraped ({len(html_content)} bytes)")
 
             return html_content
 
         except Exception as e:
             logger.error(f"Error during scraping: {e}")
+            # Start a fresh browser next time rather than reuse a broken one
+            _quit_driver()
             raise
 
-        finally:
-            if driver:
-                driver.quit()
-
     def download_data(self) -> str:
         """
         Download the OVH IP documentation HTML page.
@@ -152,7 +233,7 @@ class OVHIP:
         else:
             logger.info(f"Downloading from: {self.url} (basic request)")
             try:
-                response = requests.get(self.url, timeout=60)
+                response = get_session().get(self.url, timeout=60)
                 response.raise_for_status()
                 self.html_content = response.text
                 logger.info(f"Downloaded HTML content ({len(self.html_content)} bytes)")
@@ -173,8 +254,8 @@ class OVHIP:
         """
         logger.info(f"Using static data file: {self.data_file}")
 
-        with open(self.data_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(self.data_file, 'rb') as f:
+            data = json_loads(f.read())
 
         services_ips = {}
         all_ips = set()
@@ -185,34 +266,29 @@ class OVHIP:
 
             # Main cluster IPs
             if 'main' in cluster_data:
-                for country, ips in cluster_data['main'].items():
-                    for ip in ips:
-                        if is_valid_ip(ip):
-                            # Add to cluster
-                            if cluster_name not in services_ips:
-                                services_ips[cluster_name] = set()
-                            services_ips[cluster_name].add(ip)
-                            all_ips.add(ip)
+                candidates = set()
+                for ips in cluster_data['main'].values():
+                    candidates.update(ips)
+                valid = filter_valid_ips(candidates)
+                if valid:
+                    services_ips.setdefault(cluster_name, set()).update(valid)
+                    all_ips.update(valid)
 
             # CDN IPs
             if 'cdn' in cluster_data:
                 cdn_name = f"{cluster_name}-CDN"
-                for ip in cluster_data['cdn']:
-                    if is_valid_ip(ip):
-                        if cdn_name not in services_ips:
-                            services_ips[cdn_name] = set()
-                        services_ips[cdn_name].add(ip)
-                        all_ips.add(ip)
+                valid = filter_valid_ips(set(cluster_data['cdn']))
+                if valid:
+                    services_ips.setdefault(cdn_name, set()).update(valid)
+                    all_ips.update(valid)
 
             # Gateway IPs
             if 'gateway' in cluster_data:
                 gateway_name = f"{cluster_name}-Gateway"
-                for ip in cluster_data['gateway']:
-                    if is_valid_ip(ip):
-                        if gateway_name not in services_ips:
-                            services_ips[gateway_name] = set()
-                        services_ips[gateway_name].add(ip)
-                        all_ips.add(ip)
+                valid = filter_valid_ips(set(cluster_data['gateway']))
+                if valid:
+                    services_ips.setdefault(gateway_name, set()).update(valid)
+                    all_ips.update(valid)
 
         return services_ips, all_ips
 
@@ -230,26 +306,18 @@ class OVHIP:
         if not self.html_content:
             raise ValueError("HTML content not loaded. Call download_data() first.")
 
-        soup = BeautifulSoup(self.html_content, 'html.parser')
+        tree = lxml_html.document_fromstring(self.html_content)
         clusters_data = {}
         countries_data = {}
-        all_ips = set()
-
-        # Pattern to match IP addresses (relaxed boundaries to handle "Copy" button text)
-        ipv4_pattern = re.compile(r'(?:[0-9]{1,3}\.){3}[0-9]{1,3}')
-        ipv6_pattern = re.compile(r'(?:[0-9a-fA-F]{1,4}:){3,7}[0-9a-fA-F]{1,4}')
-
-        # Pattern to detect country codes (2 uppercase letters)
-        country_code_pattern = re.compile(r'\b([A-Z]{2})\b')
 
         # Find all h3 elements containing cluster headers
-        cluster_headers = soup.find_all('h3', string=re.compile(r'Cluster\s+\d+', re.IGNORECASE))
+        cluster_headers = _CLUSTER_HEADERS_XPATH(tree)
 
         logger.info(f"Found {len(cluster_headers)} clusters")
 
         for h3 in cluster_headers:
             # Extract cluster number
-            cluster_match = re.search(r'Cluster\s+(\d+)', h3.get_text(), re.IGNORECASE)
+            cluster_match = _CLUSTER_HDR_RE.search(h3.text_content())
             if not cluster_match:
                 continue
 
@@ -264,38 +332,28 @@ class OVHIP:
             }
 
             # Find the table following this h3
-            table = h3.find_next('table')
-            if table:
+            tables = _NEXT_TABLE_XPATH(h3)
+            table = tables[0] if tables else None
+            if table is not None:
                 # Extract IPs from table rows (organized by country)
-                for row in table.find_all('tr'):
-                    cells = row.find_all(['td', 'th'])
+                # Element.iter() walks the subtree in C, without the XPath engine
+                for row in table.iter('tr'):
+                    cells = list(row.iter('td', 'th'))
 
                     if len(cells) < 3:  # Skip header or incomplete rows
                         continue
 
-                    row_text = ' '.join([cell.get_text() for cell in cells])
+                    # Cells are space-joined so a match cannot straddle two cells
+                    row_text = ' '.join([cell.text_content() for cell in cells])
 
                     # Try to find country code in this row
-                    country_match = country_code_pattern.search(row_text)
+                    country_match = _COUNTRY_RE.search(row_text)
                     current_country = country_match.group(1) if country_match else None
 
-                    # Extract all IPs from this row
-                    row_ips = set()
-
-                    for cell in cells:
-                        text = cell.get_text()
-
-                        # Extract IPv4
-                        for ip in ipv4_pattern.findall(text):
-                            if is_valid_ip(ip):
-                                row_ips.add(ip)
-                                all_ips.add(ip)
-
-                        # Extract IPv6
-                        for ip in ipv6_pattern.findall(text):
-                            if is_valid_ip(ip):
-                                row_ips.add(ip)
-                                all_ips.add(ip)
+                    # Extract all IPs from this row (deduplicated before validation)
+                    candidates = set(_IPV4_RE.findall(row_text))
+                    candidates.update(_IPV6_RE.findall(row_text))
+                    row_ips = set(filter_valid_ips(candidates))
 
                     # Add IPs to cluster main
                     clusters_data[cluster_num]['main'].update(row_ips)
@@ -313,52 +371,45 @@ class OVHIP:
                         countries_data[current_country].update(row_ips)
 
             # Look for CDN and Gateway info after the table
-            next_sibling = table.find_next_sibling() if table else h3.find_next_sibling()
+            next_sibling = _next_sibling(table if table is not None else h3)
             section_count = 0
-            while next_sibling and section_count < 10:  # Limit search
-                text = next_sibling.get_text()
-
-                # CDN section - look for "CDN" keyword, then check this and next element for IPs
-                if 'CDN' in text or 'cdn' in text.lower():
+            while next_sibling is not None and section_count < 10:  # Limit search
+                text = next_sibling.text_content()
+                lower_text = text.lower()
+
+                # CDN section ("CDN" keyword) and/or Gateway section ("gateway" or
+                # "outgoing" keywords): one scan of this and the next element serves both
+                targets = []
+                if 'cdn' in lower_text:
+                    targets.append('cdn')
+                if 'gateway' in lower_text or 'outgoing' in lower_text:
+                    targets.append('gateway')
+
+                if targets:
                     # Check current element
-                    for ip in ipv4_pattern.findall(text):
-                        if is_valid_ip(ip):
-                            clusters_data[cluster_num]['cdn'].add(ip)
-                            all_ips.add(ip)
+                    candidates = set(_ipv4_candidates(text))
 
                     # Also check next sibling (IP might be in next <div>/<pre> element)
-                    next_elem = next_sibling.find_next_sibling()
-                    if next_elem:
-                        next_text = next_elem.get_text()
-                        for ip in ipv4_pattern.findall(next_text):
-                            if is_valid_ip(ip):
-                                clusters_data[cluster_num]['cdn'].add(ip)
-                                all_ips.add(ip)
-
-                # Gateway section - look for "gateway" or "outgoing" keywords
-                if 'gateway' in text.lower() or 'outgoing' in text.lower():
-                    # Check current element
-                    for ip in ipv4_pattern.findall(text):
-                        if is_valid_ip(ip):
-                            clusters_data[cluster_num]['gateway'].add(ip)
-                            all_ips.add(ip)
+                    next_elem = _next_sibling(next_sibling)
+                    if next_elem is not None:
+                        candidates.update(_ipv4_candidates(next_elem.text_content()))
 
-                    # Also check next sibling (IP might be in next <div>/<pre> element)
-                    next_elem = next_sibling.find_next_sibling()
-                    if next_elem:
-                        next_text = next_elem.get_text()
-                        for ip in ipv4_pattern.findall(next_text):
-                            if is_valid_ip(ip):
-                                clusters_data[cluster_num]['gateway'].add(ip)
-                                all_ips.add(ip)
+                    valid = filter_valid_ips(candidates)
+                    for target in targets:
+                        clusters_data[cluster_num][target].update(valid)
 
                 # Stop if we hit next cluster
-                if re.search(r'Cluster\s+\d+', text, re.IGNORECASE):
+                if 'cluster' in lower_text and _CLUSTER_HDR_RE.search(text):
                     break
 
-                next_sibling = next_sibling.find_next_sibling()
+                next_sibling = _next_sibling(next_sibling)
                 section_count += 1
 
+        # Every IP belongs to some cluster set: one C-level union builds the global set
+        all_ips = set().union(
+            *(cluster_info[kind] for cluster_info in clusters_data.values() for kind in ('main', 'cdn', 'gateway'))
+        )
+
         logger.info(f"Extracted {len(clusters_data)} clusters")
         logger.info(f"Extracted {len(countries_data)} countries")
         logger.info(f"Total IPs found: {len(all_ips)}")
@@ -398,89 +449,75 @@ class OVHIP:
                 logger.info("Tip: Install Selenium for automatic scraping: pip install selenium")
             return
 
-        # Convert sets to lists and separate IPv4/IPv6 for global files
+        # Separate IPv4/IPv6 for global files (straight from the deduplicated set)
         logger.info("Separating IPv4/IPv6...")
-        all_ips_list = list(all_ips)
-        all_ipv4, all_ipv6 = separate_ipv4_ipv6(all_ips_list)
-
-        # Generate global files at root level
-        logger.info("Generating global files...")
-        all_combined = all_ipv4 + all_ipv6
-        base_path = os.path.join(self.output_dir, "ips")
-        write_separated_ip_files(base_path, all_combined, "all")
-        write_separated_ip_files(base_path, all_ipv4, "ipv4")
-        write_separated_ip_files(base_path, all_ipv6, "ipv6")
-
-        # Generate clusters/ files
-        logger.info(f"Generating cluster files ({len(clusters_data)} clusters)...")
-        cluster_counts = {}
-        for cluster_num, cluster_info in sorted(clusters_data.items()):
-            cluster_name = f"Cluster-{cluster_num}"
-
-            # Get all IPs for this cluster (main IPs)
-            cluster_ips = list(cluster_info['main'])
-            if cluster_ips:
-                cluster_ipv4, cluster_ipv6 = separate_ipv4_ipv6(cluster_ips)
-
-                # Write files with separation of single IPs and ranges
-                base_path = os.path.join(self.clusters_dir, f"cluster-{cluster_num}")
-                all_combined = cluster_ipv4 + cluster_ipv6
-                write_separated_ip_files(base_path, all_combined, "all")
-
-                # Write IPv4 if present
-                if cluster_ipv4:
-                    write_separated_ip_files(base_path, cluster_ipv4, "ipv4")
-
-                # Write IPv6 if present
-                if cluster_ipv6:
-                    write_separated_ip_files(base_path, cluster_ipv6, "ipv6")
-
-                cluster_counts[cluster_name] = len(cluster_ips)
-
-        # Generate services/ files (CDN and Gateway per cluster)
-        logger.info("Generating service files...")
-        service_file_count = 0
-        for cluster_num, cluster_info in sorted(clusters_data.items()):
-            # CDN file
+        all_ipv4, all_ipv6 = separate_ipv4_ipv6(all_ips)
+
+        # Gather cluster (main) and service (CDN/Gateway) buckets in one pass over
+        # the clusters. Empty clusters (CDN/Gateway only) get no cluster files.
+        cluster_buckets = {}
+        service_buckets = {}
+        for cluster_num, cluster_info in clusters_data.items():
+            if cluster_info['main']:
+                cluster_buckets[cluster_num] = cluster_info['main']
             if cluster_info['cdn']:
-                cdn_ips = list(cluster_info['cdn'])
-                cdn_ipv4, cdn_ipv6 = separate_ipv4_ipv6(cdn_ips)
-                base_path = os.path.join(self.services_dir, f"cluster-{cluster_num}_cdn")
-                write_separated_ip_files(base_path, cdn_ipv4 + cdn_ipv6, "all")
-                service_file_count += 1
-
-            # Gateway file
+                service_buckets[f"cluster-{cluster_num}_cdn"] = cluster_info['cdn']
             if cluster_info['gateway']:
-                gateway_ips = list(cluster_info['gateway'])
-                gateway_ipv4, gateway_ipv6 = separate_ipv4_ipv6(gateway_ips)
-                base_path = os.path.join(self.services_dir, f"cluster-{cluster_num}_gateway")
-                write_separated_ip_files(base_path, gateway_ipv4 + gateway_ipv6, "all")
-                service_file_count += 1
-
-        logger.info(f"Generated {service_file_count} service files")
-
-        # Generate countries/ files
-        logger.info(f"Generating country files ({len(countries_data)} countries)...")
-        country_counts = {}
-        for country_code, country_ips in sorted(countries_data.items()):
-            country_ips_list = list(country_ips)
-            if country_ips_list:
-                country_ipv4, country_ipv6 = separate_ipv4_ipv6(country_ips_list)
+                service_buckets[f"cluster-{cluster_num}_gateway"] = cluster_info['gateway']
+
+        # Split every bucket by family from the global classification (set
+        # intersections) rather than re-classifying each bucket's IPs
+        cluster_families = split_buckets_by_family(cluster_buckets, all_ipv4, all_ipv6)
+        service_families = split_buckets_by_family(service_buckets, all_ipv4, all_ipv6)
+        country_families = split_buckets_by_family(
+            {code: ips for code, ips in countries_data.items() if ips}, all_ipv4, all_ipv6
+        )
 
-                # Write files with separation of single IPs and ranges
-                base_path = os.path.join(self.countries_dir, country_code)
-                all_combined = country_ipv4 + country_ipv6
-                write_separated_ip_files(base_path, all_combined, "all")
+        # Global, cluster, service and country files are independent: write them concurrently
+        logger.info("Generating global files...")
+        logger.info(f"Generating cluster files ({len(cluster_families)} clusters)...")
+        logger.info(f"Generating service files ({len(service_families)} services)...")
+        logger.info(f"Generating country files ({len(country_families)} countries)...")
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # Write global files with separation of single IPs and ranges
+            pending = [executor.submit(
+                write_all_splits, os.path.join(self.output_dir, "ips"), all_ipv4, all_ipv6
+            )]
+            # Services (CDN and Gateway per cluster) only get the "all" files
+            pending.extend(
+                executor.submit(
+                    write_separated_ip_files,
+                    os.path.join(self.services_dir, service_name),
+                    chain(service_ipv4, service_ipv6),
+                    "all"
+                )
+                for service_name, (service_ipv4, service_ipv6) in service_families.items()
+            )
+            # Clusters and countries get all/ipv4/ipv6 files (names used as-is:
+            # country codes stay upper case)
+            pending.extend(
+                executor.submit(
+                    write_all_splits, os.path.join(self.clusters_dir, f"cluster-{num}"), cluster_ipv4, cluster_ipv6
+                )
+                for num, (cluster_ipv4, cluster_ipv6) in cluster_families.items()
+            )
+            pending.extend(
+                executor.submit(
+                    write_all_splits, os.path.join(self.countries_dir, country_code), country_ipv4, country_ipv6
+                )
+                for country_code, (country_ipv4, country_ipv6) in country_families.items()
+            )
 
-                # Write IPv4 if present
-                if country_ipv4:
-                    write_separated_ip_files(base_path, country_ipv4, "ipv4")
+            for future in pending:
+                future.result()
 
-                # Write IPv6 if present
-                if country_ipv6:
-                    write_separated_ip_files(base_path, country_ipv6, "ipv6")
+        cluster_counts = {
+            f"Cluster-{num}": len(cluster_ipv4) + len(cluster_ipv6)
+            for num, (cluster_ipv4, cluster_ipv6) in sorted(cluster_families.items())
+        }
+        service_file_count = len(service_families)
 
-                country_counts[country_code] = len(country_ips_list)
+        logger.info(f"Generated {service_file_count} service files")
 
         # Calculate detailed stats (single IPs vs ranges)
         detailed_stats = calculate_detailed_stats(all_ips, all_ipv4, all_ipv6)
@@ -493,7 +530,7 @@ class OVHIP:
             ipv4_ranges=detailed_stats['ipv4_ranges'],
             ipv6_ranges=detailed_stats['ipv6_ranges'],
             ipv4_count=detailed_stats['ipv4_count'],
-            ipv6_count=calculate_total_ips(all_ipv6),
+            ipv6_count=detailed_stats['ipv6_count'],
             services=cluster_counts,
             regions=None,  # OVH doesn't expose regions
             ipv4_single=detailed_stats['ipv4_single'],
@@ -512,7 +549,7 @@ class OVHIP:
             'output_dir': self.output_dir
         }
         print_summary("OVH", stats)
-        logger.info(f"Additional files: {service_file_count} service files, {len(country_counts)} country files")
+        logger.info(f"Additional files: {service_file_count} service files, {len(country_families)} country files")
 
 
 def main():
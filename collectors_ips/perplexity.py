@@ -9,81 +9,113 @@ Perplexity provides two JSON files:
 
 import os
 import sys
-import json
 import logging
 import requests
+import urllib3
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
 
 from .ip_utils import (
-    separate_ipv4_ipv6,
-    write_separated_ip_files,
+    separate_ipv4_ipv6_with_stats,
+    split_buckets_by_family,
     generate_index_markdown,
-    calculate_total_ips,
     print_summary,
     ensure_directory,
-    is_valid_ip,
-    sanitize_filename,
-    calculate_detailed_stats
+    get_session,
+    write_all_splits,
+    write_bucket_files,
+    load_config,
+    json_loads,
+    read_response_body,
+    iter_json_array,
+    JSON_STREAMING_AVAILABLE
 )
 
 logger = logging.getLogger(__name__)
 
+# Map URL patterns to service names
+_SERVICE_MAPPING = {
+    'perplexitybot': 'perplexitybot',
+    'perplexity-user': 'perplexity-user'
+}
+
 
 class PerplexityIP:
     """Perplexity IP ranges synchronization manager."""
 
     def __init__(self, config_path: str = "config.json"):
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = load_config(config_path)
         self.urls = config['perplexity']['urls']
         self.output_dir = os.path.join("cloud_ips", "perplexity")
         self.services_dir = os.path.join(self.output_dir, "services")
 
-    def download_data(self) -> tuple:
+    def _download_url(self, url: str) -> Tuple[str, List[str]]:
         """
-        Download Perplexity IP ranges from multiple JSON files.
+        Download one Perplexity JSON file and extract its valid prefixes.
+
+        Args:
+            url: URL of the JSON file
 
         Returns:
-            Tuple of (all_ips, services_ips)
+            Tuple of (service_name, ips) with ips in feed order, not yet
+            validated (empty on error)
         """
-        all_ips = []
-        services_ips = {}
-
-        # Map URL patterns to service names
-        service_mapping = {
-            'perplexitybot': 'perplexitybot',
-            'perplexity-user': 'perplexity-user'
-        }
-
-        for url in self.urls:
-            logger.info(f"Downloading from: {url}")
-            try:
-                response = requests.get(url, timeout=30)
+        # Determine service name from URL
+        service_name = 'unknown'
+        for key, name in _SERVICE_MAPPING.items():
+            if key in url:
+                service_name = name
+                break
+
+        logger.info(f"Downloading from: {url}")
+        try:
+            with get_session().get(url, timeout=30, stream=True) as response:
                 response.raise_for_status()
-                data = response.json()
-
-                # Determine service name from URL
-                service_name = 'unknown'
-                for key, name in service_mapping.items():
-                    if key in url:
-                        service_name = name
-                        break
-
-                # Extract IPs from prefixes array
-                prefixes = data.get('prefixes', [])
+                if JSON_STREAMING_AVAILABLE:
+                    # Parse prefixes one at a time as they arrive
+                    prefixes = iter_json_array(response, "prefixes", {})
+                else:
+                    prefixes = json_loads(read_response_body(response)).get('prefixes', [])
+
+                # Extract IPs from prefixes array. The feed is structured (one CIDR
+                # per key), so entries are validated once, by the family split in
+                # generate_files, rather than one by one here
+                prefix_count = 0
+                ips = []
                 for prefix in prefixes:
+                    prefix_count += 1
                     if isinstance(prefix, dict):
                         ip = prefix.get('ipv4Prefix') or prefix.get('ipv6Prefix', '')
-                        if ip and is_valid_ip(ip):
-                            all_ips.append(ip)
+                        if ip and isinstance(ip, str):
+                            ips.append(ip)
+
+            logger.info(f"Downloaded {prefix_count} prefixes from {service_name}")
+            return service_name, ips
+
+        except (requests.RequestException, urllib3.exceptions.HTTPError, ValueError) as e:
+            # One broken feed must not discard the others: log it and skip it
+            logger.error(f"Error downloading from {url}: {e}")
+            return service_name, []
+
+    def download_data(self) -> tuple:
+        """
+        Download Perplexity IP ranges from multiple JSON files.
 
-                            if service_name not in services_ips:
-                                services_ips[service_name] = set()
-                            services_ips[service_name].add(ip)
+        The URLs are fetched concurrently; results keep the configured order.
 
-                logger.info(f"Downloaded {len(prefixes)} prefixes from {service_name}")
+        Returns:
+            Tuple of (all_ips, services_ips)
+        """
+        all_ips = []
+        services_ips = {}
 
-            except requests.RequestException as e:
-                logger.error(f"Error downloading from {url}: {e}")
+        with ThreadPoolExecutor(max_workers=min(8, len(self.urls)) or 1) as executor:
+            results = list(executor.map(self._download_url, self.urls))
+
+        for service_name, ips in results:
+            if ips:
+                all_ips.extend(ips)
+                services_ips.setdefault(service_name, set()).update(ips)
 
         logger.info(f"Total: {len(all_ips)} IPs from {len(services_ips)} services")
         return all_ips, services_ips
@@ -98,40 +130,27 @@ class PerplexityIP:
             logger.info("Warning: No IP ranges found!")
             return
 
-        # Separate IPv4/IPv6
+        # Separate IPv4/IPv6 (this single pass also drops invalid entries)
         logger.info("Separating IPv4/IPv6...")
-        all_ipv4, all_ipv6 = separate_ipv4_ipv6(all_ips_list)
+        all_ipv4, all_ipv6, detailed_stats = separate_ipv4_ipv6_with_stats(all_ips_list)
 
-        # Generate global files
+        # Global and per-service files are independent: write them concurrently
         logger.info("Generating global files...")
-        all_combined = all_ipv4 + all_ipv6
-        base_path = os.path.join(self.output_dir, "ips")
-        write_separated_ip_files(base_path, all_combined, "all")
-        write_separated_ip_files(base_path, all_ipv4, "ipv4")
-        write_separated_ip_files(base_path, all_ipv6, "ipv6")
-
-        # Generate per-service files
         logger.info(f"Generating service files ({len(services_ips)} services)...")
-        service_counts = {}
-        for service_name, ips in services_ips.items():
-            safe_name = sanitize_filename(service_name)
-            ips_list = list(ips)
-            ipv4, ipv6 = separate_ipv4_ipv6(ips_list)
-
-            base_path = os.path.join(self.services_dir, safe_name)
-            all_combined = ipv4 + ipv6
-            write_separated_ip_files(base_path, all_combined, "all")
-
-            if ipv4:
-                write_separated_ip_files(base_path, ipv4, "ipv4")
-
-            if ipv6:
-                write_separated_ip_files(base_path, ipv6, "ipv6")
-
-            service_counts[service_name] = len(ips)
-
-        # Calculate detailed stats
-        detailed_stats = calculate_detailed_stats(all_ips_list, all_ipv4, all_ipv6)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Write global files with separation of single IPs and ranges
+            global_files = executor.submit(
+                write_all_splits, os.path.join(self.output_dir, "ips"), all_ipv4, all_ipv6
+            )
+            service_files = executor.submit(
+                write_bucket_files,
+                self.services_dir,
+                split_buckets_by_family(services_ips, all_ipv4, all_ipv6),
+                presplit=True
+            )
+
+            global_files.result()
+            service_counts = service_files.result()
 
         # Generate index.md
         logger.info("Generating index.md...")
@@ -141,7 +160,7 @@ class PerplexityIP:
             ipv4_ranges=detailed_stats['ipv4_ranges'],
             ipv6_ranges=detailed_stats['ipv6_ranges'],
             ipv4_count=detailed_stats['ipv4_count'],
-            ipv6_count=calculate_total_ips(all_ipv6),
+            ipv6_count=detailed_stats['ipv6_count'],
             services=service_counts,
             regions=None,
             ipv4_single=detailed_stats['ipv4_single'],
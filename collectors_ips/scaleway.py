@@ -8,33 +8,126 @@ IP range information organized by services and regions.
 
 import os
 import sys
-import json
 import re
 import requests
 import logging
+from bisect import bisect_right
+from typing import Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Only the page text is needed: prefer lxml's C parser, fall back to BeautifulSoup
+try:
+    from lxml import etree, html as lxml_html
+except ImportError:
+    lxml_html = None
+
 try:
     from bs4 import BeautifulSoup
 except ImportError:
-    logger.info("Error: BeautifulSoup4 is required for HTML parsing.")
-    logger.info("Install with: pip install beautifulsoup4")
+    BeautifulSoup = None
+
+if lxml_html is None and BeautifulSoup is None:
+    logger.info("Error: lxml or BeautifulSoup4 is required for HTML parsing.")
+    logger.info("Install with: pip install lxml")
     sys.exit(1)
 
 # Import shared utilities
 from .ip_utils import (
     separate_ipv4_ipv6,
-    write_separated_ip_files,
     generate_index_markdown,
-    calculate_total_ips,
-    sanitize_filename,
     print_summary,
     ensure_directory,
+    get_session,
     is_valid_ip,
-    calculate_detailed_stats
+    calculate_detailed_stats,
+    write_all_splits,
+    write_bucket_files,
+    split_buckets_by_family,
+    load_config
+)
+
+
+# IP addresses and CIDR ranges. The IPv6 branch accepts the same strings as
+# (?:[0-9a-fA-F:]+:){2,}[0-9a-fA-F:]+ (two or more "x+:" groups, then a tail),
+# written without nested quantifiers so long runs of ':' cannot make the
+# engine backtrack exponentially
+_IP_RE = re.compile(
+    r'\b(?:'
+    r'(?:[0-9]{1,3}\.){3}[0-9]{1,3}(?:/[0-9]{1,2})?|'  # IPv4 with optional CIDR
+    r'[0-9a-fA-F:][0-9a-fA-F]*:[0-9a-fA-F:][0-9a-fA-F]*:[0-9a-fA-F:]+(?:/[0-9]{1,3})?'  # IPv6 with optional CIDR
+    r')\b'
+)
+
+# Region codes (fr-par-1, nl-ams-2, etc.)
+_REGION_RE = re.compile(r'\b(fr-par-[1-3]|nl-ams-[1-3]|pl-waw-[1-3])\b', re.IGNORECASE)
+
+# Any keyword that _update_section() reacts to (lines without one keep the section)
+_SECTION_KEYWORD_RE = re.compile(
+    r'IPv4|IPv6|DNS cache servers|NTP servers|France|Netherlands|Poland|'
+    r'Rdate server|Backup server|RPN VPN|Monitoring|Dedibox'
 )
 
+_NEWLINE_RE = re.compile(r'\n')
+
+# Region mapping for Scaleway zones
+_REGION_MAPPING = {
+    'fr-par-1': 'France-Paris-1',
+    'fr-par-2': 'France-Paris-2',
+    'fr-par-3': 'France-Paris-3',
+    'nl-ams-1': 'Netherlands-Amsterdam-1',
+    'nl-ams-2': 'Netherlands-Amsterdam-2',
+    'nl-ams-3': 'Netherlands-Amsterdam-3',
+    'pl-waw-1': 'Poland-Warsaw-1',
+    'pl-waw-2': 'Poland-Warsaw-2',
+    'pl-waw-3': 'Poland-Warsaw-3'
+}
+
+
+def _update_section(line: str, current_service: str, current_region: Optional[str]) -> Tuple[str, Optional[str]]:
+    """
+    Apply a (stripped) text line's service/region headers to the current section.
+
+    Args:
+        line: Stripped line of the page text
+        current_service: Service in effect before this line
+        current_region: Region in effect before this line
+
+    Returns:
+        Tuple of (service, region) in effect for this line
+    """
+    # Detect service/section headers
+    if 'IPv4' in line and len(line) < 20:
+        current_service = "Core-IPv4-Ranges"
+    elif 'IPv6' in line and len(line) < 20:
+        current_service = "Core-IPv6-Ranges"
+    elif 'DNS cache servers' in line or 'NTP servers' in line:
+        current_service = "DNS-NTP-Servers"
+    elif 'France' in line and len(line) < 20:
+        current_region = 'France'
+    elif 'Netherlands' in line and len(line) < 20:
+        current_region = 'Netherlands'
+    elif 'Poland' in line and len(line) < 20:
+        current_region = 'Poland'
+    elif 'Rdate server' in line:
+        current_service = "Rdate-Server"
+    elif 'Backup server' in line:
+        current_service = "Backup-Server"
+    elif 'RPN VPN' in line:
+        current_service = "RPN-VPN"
+    elif 'Monitoring' in line:
+        current_service = "Monitoring"
+    elif 'Dedibox' in line and len(line) < 50:
+        current_service = "Dedibox-Services"
+
+    # Check for region codes (fr-par-1, nl-ams-2, etc.)
+    region_match = _REGION_RE.search(line)
+    if region_match:
+        zone_code = region_match.group(1).lower()
+        current_region = _REGION_MAPPING.get(zone_code, zone_code)
+
+    return current_service, current_region
+
 
 class ScalewayIP:
     """Scaleway IP ranges synchronization manager."""
@@ -46,32 +139,47 @@ class ScalewayIP:
         Args:
             config_path: Path to configuration file
         """
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = load_config(config_path)
 
         self.url = config['scaleway']['url']
         self.output_dir = os.path.join("cloud_ips", "scaleway")
         self.services_dir = os.path.join(self.output_dir, "services")
         self.regions_dir = os.path.join(self.output_dir, "regions")
         self.html_content = None
+        self.html_tree = None
 
-    def download_data(self) -> str:
+    def download_data(self) -> None:
         """
         Download the Scaleway network information HTML page.
 
-        Returns:
-            str: HTML content
+        With lxml, the page is parsed incrementally as chunks arrive (sets
+        self.html_tree) and the raw HTML is never held as a whole; otherwise
+        the decoded page is kept in self.html_content for BeautifulSoup.
 
         Raises:
             requests.RequestException: If download fails
         """
         logger.info(f"[Scaleway] Downloading from: {self.url}")
         try:
-            response = requests.get(self.url, timeout=60)
-            response.raise_for_status()
-            self.html_content = response.text
-            logger.info(f"[Scaleway] Successfully downloaded HTML content ({len(self.html_content)} bytes)")
-            return self.html_content
+            with get_session().get(self.url, timeout=60, stream=True) as response:
+                response.raise_for_status()
+
+                if lxml_html is None:
+                    self.html_content = response.text
+                    logger.info(f"[Scaleway] Successfully downloaded HTML content ({len(self.html_content)} bytes)")
+                    return
+
+                # Only force the charset the server declared; otherwise let lxml
+                # detect it from the page (BOM / <meta charset>)
+                content_type = response.headers.get('Content-Type', '').lower()
+                parser = lxml_html.HTMLParser(encoding=response.encoding if 'charset' in content_type else None)
+                size = 0
+                for chunk in response.iter_content(65536):
+                    parser.feed(chunk)
+                    size += len(chunk)
+                self.html_tree = parser.close()
+
+            logger.info(f"[Scaleway] Successfully downloaded HTML content ({size} bytes)")
         except requests.RequestException as e:
             logger.error(f"[Scaleway] Error downloading data: {e}")
             raise
@@ -86,79 +194,53 @@ class ScalewayIP:
             - regions_ips: Dict mapping region names to IP sets
             - all_ips: Set of all IP ranges
         """
-        if not self.html_content:
+        if self.html_tree is None and not self.html_content:
             raise ValueError("HTML content not loaded. Call download_data() first.")
 
-        soup = BeautifulSoup(self.html_content, 'html.parser')
         services_ips = {}
         regions_ips = {}
         all_ips = set()
 
-        # Pattern to match IP addresses and CIDR ranges
-        ip_pattern = re.compile(
-            r'\b(?:'
-            r'(?:[0-9]{1,3}\.){3}[0-9]{1,3}(?:/[0-9]{1,2})?|'  # IPv4 with optional CIDR
-            r'(?:[0-9a-fA-F:]+:){2,}(?:[0-9a-fA-F:]+)(?:/[0-9]{1,3})?'  # IPv6 with optional CIDR
-            r')\b'
-        )
-
-        # Region mapping for Scaleway zones
-        region_mapping = {
-            'fr-par-1': 'France-Paris-1',
-            'fr-par-2': 'France-Paris-2',
-            'fr-par-3': 'France-Paris-3',
-            'nl-ams-1': 'Netherlands-Amsterdam-1',
-            'nl-ams-2': 'Netherlands-Amsterdam-2',
-            'nl-ams-3': 'Netherlands-Amsterdam-3',
-            'pl-waw-1': 'Poland-Warsaw-1',
-            'pl-waw-2': 'Poland-Warsaw-2',
-            'pl-waw-3': 'Poland-Warsaw-3'
-        }
-
         current_service = "General"
         current_region = None
 
         # Parse text content
-        text_content = soup.get_text()
-        lines = text_content.split('\n')
-
-        for i, line in enumerate(lines):
-            line = line.strip()
-
-            # Detect service/section headers
-            if 'IPv4' in line and len(line) < 20:
-                current_service = "Core-IPv4-Ranges"
-            elif 'IPv6' in line and len(line) < 20:
-                current_service = "Core-IPv6-Ranges"
-            elif 'DNS cache servers' in line or 'NTP servers' in line:
-                current_service = "DNS-NTP-Servers"
-            elif 'France' in line and len(line) < 20:
-                current_region = 'France'
-            elif 'Netherlands' in line and len(line) < 20:
-                current_region = 'Netherlands'
-            elif 'Poland' in line and len(line) < 20:
-                current_region = 'Poland'
-            elif 'Rdate server' in line:
-                current_service = "Rdate-Server"
-            elif 'Backup server' in line:
-                current_service = "Backup-Server"
-            elif 'RPN VPN' in line:
-                current_service = "RPN-VPN"
-            elif 'Monitoring' in line:
-                current_service = "Monitoring"
-            elif 'Dedibox' in line and len(line) < 50:
-                current_service = "Dedibox-Services"
-
-            # Check for region codes (fr-par-1, nl-ams-2, etc.)
-            region_match = re.search(r'\b(fr-par-[1-3]|nl-ams-[1-3]|pl-waw-[1-3])\b', line, re.IGNORECASE)
-            if region_match:
-                zone_code = region_match.group(1).lower()
-                current_region = region_mapping.get(zone_code, zone_code)
-
-            # Extract IPs from this line
-            found_ips = ip_pattern.findall(line)
-            for ip in found_ips:
-                if is_valid_ip(ip):
+        if lxml_html is not None:
+            tree = self.html_tree
+            if tree is None:
+                tree = lxml_html.document_fromstring(self.html_content)
+            # Like BeautifulSoup's get_text(), leave out script/style/template code
+            etree.strip_elements(tree, 'script', 'style', 'template', with_tail=False)
+            text_content = tree.text_content()
+        else:
+            text_content = BeautifulSoup(self.html_content, 'html.parser').get_text()
+
+        # Scan the whole text once per pattern instead of once per line: matches
+        # never span a newline, so each is then mapped to its line by bisection
+        line_starts = [0]
+        line_starts.extend(match.end() for match in _NEWLINE_RE.finditer(text_content))
+        line_starts.append(len(text_content) + 1)
+
+        # Lines that may change the current service/region, and the IPs on each line
+        section_lines = {
+            bisect_right(line_starts, match.start()) - 1
+            for pattern in (_SECTION_KEYWORD_RE, _REGION_RE)
+            for match in pattern.finditer(text_content)
+        }
+        line_ips = {}
+        for match in _IP_RE.finditer(text_content):
+            line_ips.setdefault(bisect_right(line_starts, match.start()) - 1, []).append(match.group())
+
+        # Walk the relevant lines in order: a line's section change applies
+        # before its own IPs
+        valid_ip = is_valid_ip  # local alias for the hot loop
+        for index in sorted(section_lines.union(line_ips)):
+            if index in section_lines:
+                line = text_content[line_starts[index]:line_starts[index + 1] - 1].strip()
+                current_service, current_region = _update_section(line, current_service, current_region)
+
+            for ip in line_ips.get(index, ()):
+                if valid_ip(ip):
                     # Add to services
                     if current_service not in services_ips:
                         services_ips[current_service] = set()
@@ -181,7 +263,7 @@ class ScalewayIP:
         logger.info("\n[Scaleway] Starting IP range extraction from HTML...")
 
         # Download HTML content if not already loaded
-        if not self.html_content:
+        if self.html_tree is None and not self.html_content:
             self.download_data()
 
         # Create directories
@@ -204,59 +286,22 @@ class ScalewayIP:
 
         # Generate global files
         logger.info("[Scaleway] Generating global files...")
-        all_combined = all_ipv4 + all_ipv6
         # Write global files with separation of single IPs and ranges
-        base_path = os.path.join(self.output_dir, "ips")
-        write_separated_ip_files(base_path, all_combined, "all")
-        write_separated_ip_files(base_path, all_ipv4, "ipv4")
-        write_separated_ip_files(base_path, all_ipv6, "ipv6")
+        write_all_splits(os.path.join(self.output_dir, "ips"), all_ipv4, all_ipv6)
 
-        # Generate per-service files
+        # Bucket IPs all come from the global set: split them by family with
+        # set intersections instead of re-classifying each bucket
         logger.info(f"[Scaleway] Generating service files ({len(services_ips)} services)...")
-        service_counts = {}
-        for service_name, ips in services_ips.items():
-            safe_name = sanitize_filename(service_name)
-            ips_list = list(ips)
-            ipv4, ipv6 = separate_ipv4_ipv6(ips_list)
-
-            # Write files with separation of single IPs and ranges
-            base_path = os.path.join(self.services_dir, safe_name)
-            all_combined = ipv4 + ipv6
-            write_separated_ip_files(base_path, all_combined, "all")
-
-            # Write IPv4 if present
-            if ipv4:
-                write_separated_ip_files(base_path, ipv4, "ipv4")
-
-            # Write IPv6 if present
-            if ipv6:
-                write_separated_ip_files(base_path, ipv6, "ipv6")
-
-            service_counts[service_name] = len(ips)
+        service_counts = write_bucket_files(
+            self.services_dir, split_buckets_by_family(services_ips, all_ipv4, all_ipv6), presplit=True
+        )
 
         # Generate per-region files (if any regions detected)
         if regions_ips:
             logger.info(f"[Scaleway] Generating region files ({len(regions_ips)} regions)...")
-            region_counts = {}
-            for region_name, ips in regions_ips.items():
-                safe_name = sanitize_filename(region_name)
-                ips_list = list(ips)
-                ipv4, ipv6 = separate_ipv4_ipv6(ips_list)
-
-                # Write files with separation of single IPs and ranges
-                base_path = os.path.join(self.regions_dir, safe_name)
-                all_combined = ipv4 + ipv6
-                write_separated_ip_files(base_path, all_combined, "all")
-
-                # Write IPv4 if present
-                if ipv4:
-                    write_separated_ip_files(base_path, ipv4, "ipv4")
-
-                # Write IPv6 if present
-                if ipv6:
-                    write_separated_ip_files(base_path, ipv6, "ipv6")
-
-                region_counts[region_name] = len(ips)
+            region_counts = write_bucket_files(
+                self.regions_dir, split_buckets_by_family(regions_ips, all_ipv4, all_ipv6), presplit=True
+            )
         else:
             region_counts = None
 
@@ -271,7 +316,7 @@ class ScalewayIP:
             ipv4_ranges=detailed_stats['ipv4_ranges'],
             ipv6_ranges=detailed_stats['ipv6_ranges'],
             ipv4_count=detailed_stats['ipv4_count'],
-            ipv6_count=calculate_total_ips(all_ipv6),
+            ipv6_count=detailed_stats['ipv6_count'],
             services=service_counts,
             regions=region_counts,
             ipv4_single=detailed_stats['ipv4_single'],
@@ -5,7 +5,6 @@ Starlink IP Sync - Download Starlink IP ranges and generate organized files.
 
 import os
 import sys
-import json
 import requests
 import csv
 import io
@@ -14,13 +13,14 @@ from typing import List
 
 from .ip_utils import (
     separate_ipv4_ipv6,
-    write_separated_ip_files,
     generate_index_markdown,
-    calculate_total_ips,
     print_summary,
     ensure_directory,
-    is_valid_ip,
-    calculate_detailed_stats
+    get_session,
+    filter_valid_ips,
+    calculate_detailed_stats,
+    write_all_splits,
+    load_config
 )
 
 logger = logging.getLogger(__name__)
@@ -30,23 +30,18 @@ class StarlinkIP:
     """Starlink IP ranges synchronization manager."""
 
     def __init__(self, config_path: str = "config.json"):
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = load_config(config_path)
         self.url = config['starlink']['url']
         self.output_dir = os.path.join("cloud_ips", "starlink")
 
     def download_data(self) -> List[str]:
         logger.info(f"Downloading from: {self.url}")
-        all_ips = []
         try:
-            response = requests.get(self.url, timeout=30)
+            response = get_session().get(self.url, timeout=30)
             response.raise_for_status()
             csv_data = csv.reader(io.StringIO(response.text))
-            for row in csv_data:
-                for field in row:
-                    field = field.strip()
-                    if field and is_valid_ip(field):
-                        all_ips.append(field)
+            # Validate all fields in one bulk pass (order preserved)
+            all_ips = filter_valid_ips(field.strip() for row in csv_data for field in row)
             logger.info(f"Downloaded {len(all_ips)} IPs")
             return all_ips
         except requests.RequestException as e:
@@ -61,11 +56,8 @@ class StarlinkIP:
             return
 
         all_ipv4, all_ipv6 = separate_ipv4_ipv6(all_ips_list)
-        all_combined = all_ipv4 + all_ipv6
-        base_path = os.path.join(self.output_dir, "ips")
-        write_separated_ip_files(base_path, all_combined, "all")
-        write_separated_ip_files(base_path, all_ipv4, "ipv4")
-        write_separated_ip_files(base_path, all_ipv6, "ipv6")
+        # Write global files with separation of single IPs and ranges
+        write_all_splits(os.path.join(self.output_dir, "ips"), all_ipv4, all_ipv6)
 
         # Calculate detailed stats
         detailed_stats = calculate_detailed_stats(all_ips_list, all_ipv4, all_ipv6)
@@ -76,7 +68,7 @@ class StarlinkIP:
             ipv4_ranges=detailed_stats['ipv4_ranges'],
             ipv6_ranges=detailed_stats['ipv6_ranges'],
             ipv4_count=detailed_stats['ipv4_count'],
-            ipv6_count=calculate_total_ips(all_ipv6),
+            ipv6_count=detailed_stats['ipv6_count'],
             services=None,
             regions=None,
             ipv4_single=detailed_stats['ipv4_single'],
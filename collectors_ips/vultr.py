@@ -5,20 +5,22 @@ Vultr IP Sync - Download Vultr IP ranges and generate organized files.
 
 import os
 import sys
-import json
 import logging
 import requests
 
 from .ip_utils import (
     separate_ipv4_ipv6,
-    write_separated_ip_files,
     generate_index_markdown,
-    calculate_total_ips,
     print_summary,
     ensure_directory,
-    is_valid_ip,
-    sanitize_filename,
-    calculate_detailed_stats
+    get_session,
+    filter_valid_ips,
+    calculate_detailed_stats,
+    write_all_splits,
+    write_bucket_files,
+    split_buckets_by_family,
+    load_config,
+    json_loads
 )
 
 logger = logging.getLogger(__name__)
@@ -28,8 +30,7 @@ class VultrIP:
     """Vultr IP ranges synchronization manager."""
 
     def __init__(self, config_path: str = "config.json"):
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = load_config(config_path)
         self.url = config['vultr']['url']
         self.output_dir = os.path.join("cloud_ips", "vultr")
         self.regions_dir = os.path.join(self.output_dir, "regions")
@@ -37,12 +38,12 @@ class VultrIP:
     def download_data(self) -> dict:
         logger.info(f"Downloading from: {self.url}")
         try:
-            response = requests.get(self.url, timeout=30)
+            response = get_session().get(self.url, timeout=30)
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
             logger.info("Successfully downloaded JSON data")
             return data
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             logger.error(f"Error: {e}")
             return {}
 
@@ -59,23 +60,28 @@ class VultrIP:
         # Vultr JSON structure: { "subnets": [ { "ip_prefix", "city", "alpha2code", ... } ] }
         subnets = data.get('subnets', [])
 
-        for subnet in subnets:
-            if isinstance(subnet, dict):
-                ip = subnet.get('ip_prefix', '')
-                city = subnet.get('city', '')
-                country = subnet.get('alpha2code', '')
+        # Transpose the subnet records into parallel columns: one pass of
+        # dict lookups, then the loop below only reads list slots
+        records = [subnet for subnet in subnets if isinstance(subnet, dict)]
+        ips = [subnet.get('ip_prefix', '') for subnet in records]
+        cities = [subnet.get('city', '') for subnet in records]
+        countries = [subnet.get('alpha2code', '') for subnet in records]
 
-                if ip and is_valid_ip(ip):
-                    all_ips.append(ip)
+        # Validate each distinct prefix once, in bulk, then use set lookups per subnet
+        valid_ips = frozenset(filter_valid_ips({ip for ip in ips if isinstance(ip, str)}))
 
-                    # Use city as region identifier
-                    if city:
-                        # Create region name: "City, Country" (e.g., "Tokyo, JP")
-                        region_name = f"{city}, {country}" if country else city
+        for ip, city, country in zip(ips, cities, countries):
+            if isinstance(ip, str) and ip in valid_ips:
+                all_ips.append(ip)
 
-                        if region_name not in regions_ips:
-                            regions_ips[region_name] = set()
-                        regions_ips[region_name].add(ip)
+                # Use city as region identifier
+                if city:
+                    # Create region name: "City, Country" (e.g., "Tokyo, JP")
+                    region_name = f"{city}, {country}" if country else city
+
+                    if region_name not in regions_ips:
+                        regions_ips[region_name] = set()
+                    regions_ips[region_name].add(ip)
 
         logger.info(f"Extracted {len(all_ips)} IPs from {len(subnets)} subnets")
         logger.info(f"Found {len(regions_ips)} regions")
@@ -100,35 +106,15 @@ class VultrIP:
 
         # Generate global files
         logger.info("Generating global files...")
-        all_combined = all_ipv4 + all_ipv6
         # Write global files with separation of single IPs and ranges
-        base_path = os.path.join(self.output_dir, "ips")
-        write_separated_ip_files(base_path, all_combined, "all")
-        write_separated_ip_files(base_path, all_ipv4, "ipv4")
-        write_separated_ip_files(base_path, all_ipv6, "ipv6")
+        write_all_splits(os.path.join(self.output_dir, "ips"), all_ipv4, all_ipv6)
 
-        # Generate per-region files
+        # Generate per-region files concurrently, splitting each region by
+        # family from the global sets
         logger.info(f"Generating region files ({len(regions_ips)} regions)...")
-        region_counts = {}
-        for region_name, ips in regions_ips.items():
-            safe_name = sanitize_filename(region_name)
-            ips_list = list(ips)
-            ipv4, ipv6 = separate_ipv4_ipv6(ips_list)
-
-            # Write files with separation of single IPs and ranges
-            base_path = os.path.join(self.regions_dir, safe_name)
-            all_combined = ipv4 + ipv6
-            write_separated_ip_files(base_path, all_combined, "all")
-
-            # Write IPv4 if present
-            if ipv4:
-                write_separated_ip_files(base_path, ipv4, "ipv4")
-
-            # Write IPv6 if present
-            if ipv6:
-                write_separated_ip_files(base_path, ipv6, "ipv6")
-
-            region_counts[region_name] = len(ips)
+        region_counts = write_bucket_files(
+            self.regions_dir, split_buckets_by_family(regions_ips, all_ipv4, all_ipv6), presplit=True
+        )
 
         # Calculate detailed stats
         detailed_stats = calculate_detailed_stats(all_ips_list, all_ipv4, all_ipv6)
@@ -141,7 +127,7 @@ class VultrIP:
             ipv4_ranges=detailed_stats['ipv4_ranges'],
             ipv6_ranges=detailed_stats['ipv6_ranges'],
             ipv4_count=detailed_stats['ipv4_count'],
-            ipv6_count=calculate_total_ips(all_ipv6),
+            ipv6_count=detailed_stats['ipv6_count'],
             services=None,
             regions=region_counts,
             ipv4_single=detailed_stats['ipv4_single'],
@@ -5,20 +5,22 @@ Zscaler IP Sync - Download Zscaler IP ranges and generate organized files.
 
 import os
 import sys
-import json
 import logging
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 from .ip_utils import (
     separate_ipv4_ipv6,
-    write_separated_ip_files,
     generate_index_markdown,
-    calculate_total_ips,
     print_summary,
     ensure_directory,
-    is_valid_ip,
-    calculate_detailed_stats
+    get_session,
+    filter_valid_ips,
+    calculate_detailed_stats,
+    write_all_splits,
+    load_config,
+    json_loads
 )
 
 logger = logging.getLogger(__name__)
@@ -28,38 +30,62 @@ class ZscalerIP:
     """Zscaler IP ranges synchronization manager."""
 
     def __init__(self, config_path: str = "config.json"):
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = load_config(config_path)
         self.urls = config['zscaler']['urls']
         self.output_dir = os.path.join("cloud_ips", "zscaler")
 
+    def _download_url(self, url: str) -> List[str]:
+        """
+        Download one Zscaler JSON file and extract the valid IPs it contains.
+
+        Args:
+            url: URL of the JSON file
+
+        Returns:
+            List of distinct valid IP ranges (empty on error)
+        """
+        logger.info(f"Downloading from: {url}")
+        try:
+            response = get_session().get(url, timeout=30)
+            response.raise_for_status()
+            data = json_loads(response.content)
+
+            # Collect every distinct string in the JSON structure (iterative
+            # walk, no call per node), then validate them in bulk
+            strings = set()
+            add = strings.add
+            stack = [data]
+            pop = stack.pop
+            push = stack.extend
+            while stack:
+                value = pop()
+                if isinstance(value, str):
+                    add(value)
+                elif isinstance(value, list):
+                    push(value)
+                elif isinstance(value, dict):
+                    push(value.values())
+
+            logger.info(f"Downloaded data from {url}")
+            return filter_valid_ips(strings)
+
+        except (requests.RequestException, ValueError) as e:
+            logger.error(f"Error downloading from {url}: {e}")
+            return []
+
     def download_data(self) -> List[str]:
-        all_ips = []
-        for url in self.urls:
-            logger.info(f"Downloading from: {url}")
-            try:
-                response = requests.get(url, timeout=30)
-                response.raise_for_status()
-                data = response.json()
-
-                # Extract IPs from JSON structure
-                def extract_from_value(value):
-                    if isinstance(value, str) and is_valid_ip(value):
-                        all_ips.append(value)
-                    elif isinstance(value, list):
-                        for item in value:
-                            extract_from_value(item)
-                    elif isinstance(value, dict):
-                        for v in value.values():
-                            extract_from_value(v)
-
-                extract_from_value(data)
-                logger.info(f"Downloaded data from {url}")
-
-            except requests.RequestException as e:
-                logger.error(f"Error downloading from {url}: {e}")
-
-        return list(set(all_ips))  # Remove duplicates
+        """
+        Download all Zscaler JSON files concurrently.
+
+        Returns:
+            List of distinct valid IP ranges across all URLs
+        """
+        all_ips = set()
+        with ThreadPoolExecutor(max_workers=len(self.urls) or 1) as executor:
+            for ips in executor.map(self._download_url, self.urls):
+                all_ips.update(ips)
+
+        return list(all_ips)
 
     def generate_files(self) -> None:
         logger.info("\nStarting IP range extraction...")
@@ -70,13 +96,9 @@ class ZscalerIP:
             return
 
         all_ipv4, all_ipv6 = separate_ipv4_ipv6(all_ips_list)
-        all_combined = all_ipv4 + all_ipv6
 
         # Write global files with separation of single IPs and ranges
-        base_path = os.path.join(self.output_dir, "ips")
-        write_separated_ip_files(base_path, all_combined, "all")
-        write_separated_ip_files(base_path, all_ipv4, "ipv4")
-        write_separated_ip_files(base_path, all_ipv6, "ipv6")
+        write_all_splits(os.path.join(self.output_dir, "ips"), all_ipv4, all_ipv6)
 
         # Calculate detailed stats
         detailed_stats = calculate_detailed_stats(all_ips_list, all_ipv4, all_ipv6)
@@ -87,7 +109,7 @@ class ZscalerIP:
             ipv4_ranges=detailed_stats['ipv4_ranges'],
             ipv6_ranges=detailed_stats['ipv6_ranges'],
             ipv4_count=detailed_stats['ipv4_count'],
-            ipv6_count=calculate_total_ips(all_ipv6),
+            ipv6_count=detailed_stats['ipv6_count'],
             services=None,
             regions=None,
             ipv4_single=detailed_stats['ipv4_single'],
@@ -8,21 +8,22 @@ generates a consolidated summary report.
 
 import os
 import sys
+import functools
+import importlib
+import socket
 import logging
 import time
-import threading
-from typing import Dict, Set
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Set, Tuple
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from collectors_ips.ip_utils import load_config
 
 # Custom formatter for cleaner logs
 class CleanFormatter(logging.Formatter):
     """Custom formatter for cleaner output."""
 
     def format(self, record):
-        # For collector-specific logs (e.g., collectors_ips.azure) - suppress them
-        if '.' in record.name and record.name.startswith('collectors_ips.'):
-            return None  # Suppress provider logs
-
         # For main orchestrator logs
         if record.name == 'root':
             return record.getMessage()
@@ -33,20 +34,16 @@ class CleanFormatter(logging.Formatter):
 
         return record.getMessage()
 
-# Configure logging with custom formatter
-handler = logging.StreamHandler()
-handler.setFormatter(CleanFormatter())
-
-# Filter to suppress None messages
-class NonNoneFilter(logging.Filter):
+# Filter to suppress collector-specific logs (e.g., collectors_ips.azure)
+class SuppressCollectorLogs(logging.Filter):
     def filter(self, record):
-        formatter = handler.formatter
-        if formatter:
-            result = formatter.format(record)
-            return result is not None
-        return True
+        return not record.name.startswith('collectors_ips.')
 
-handler.addFilter(NonNoneFilter())
+# Configure logging with custom formatter; suppressed records are dropped
+# before being formatted
+handler = logging.StreamHandler()
+handler.setFormatter(CleanFormatter())
+handler.addFilter(SuppressCollectorLogs())
 
 logging.basicConfig(
     level=logging.INFO,
@@ -55,166 +52,133 @@ logging.basicConfig(
 
 logger = logging.getLogger()
 
+# The shared session's Retry logs a WARNING per retried connection; keep
+# those out of the orchestrator output and only report real failures
+logging.getLogger('urllib3.connectionpool').setLevel(logging.ERROR)
+
+# Seconds between two progress lines
+PROGRESS_INTERVAL = 3
+
+# Rule framing the report sections
+SEPARATOR = "=" * 70
+
+# Provider name -> (collector module, collector class), in display order
+PROVIDERS: Dict[str, Tuple[str, str]] = {
+    'Azure': ('collectors_ips.azure', 'AzureIP'),
+    'AWS': ('collectors_ips.aws', 'AWSIP'),
+    'GCP': ('collectors_ips.gcp', 'GCPIP'),
+    'OCI': ('collectors_ips.oci', 'OCIIP'),
+    'OVH': ('collectors_ips.ovh', 'OVHIP'),
+    'Scaleway': ('collectors_ips.scaleway', 'ScalewayIP'),
+    'Cloudflare': ('collectors_ips.cloudflare', 'CloudflareIP'),
+    'Fastly': ('collectors_ips.fastly', 'FastlyIP'),
+    'Linode': ('collectors_ips.linode', 'LinodeIP'),
+    'DigitalOcean': ('collectors_ips.digitalocean', 'DigitalOceanIP'),
+    'Starlink': ('collectors_ips.starlink', 'StarlinkIP'),
+    'Vultr': ('collectors_ips.vultr', 'VultrIP'),
+    'Zscaler': ('collectors_ips.zscaler', 'ZscalerIP'),
+    'IBM_Cloud': ('collectors_ips.ibm_cloud', 'IBMCloudIP'),
+    'Exoscale': ('collectors_ips.exoscale', 'ExoscaleIP'),
+    'Googlebot': ('collectors_ips.googlebot', 'GooglebotIP'),
+    'Outscale': ('collectors_ips.outscale', 'OutscaleIP'),
+    'Bingbot': ('collectors_ips.bingbot', 'BingbotIP'),
+    'Meta': ('collectors_ips.meta', 'MetaIP'),
+    'OpenAI': ('collectors_ips.openai', 'OpenAIIP'),
+    'Perplexity': ('collectors_ips.perplexity', 'PerplexityIP'),
+    'GitHub': ('collectors_ips.github', 'GitHubIP'),
+    'Ahrefs': ('collectors_ips.ahrefs', 'AhrefsIP'),
+}
+
 class ProgressMonitor:
-    """Monitor and display progress of provider execution."""
+    """
+    Monitor and display progress of provider execution.
+
+    Only the main thread updates and reads it (from the futures it waits on),
+    so no locking is needed.
+    """
 
     def __init__(self, total_providers: int):
         self.total_providers = total_providers
         self.completed: Set[str] = set()
         self.in_progress: Set[str] = set()
-        self.lock = threading.Lock()
-        self.stop_event = threading.Event()
         self.start_time = time.time()
 
     def start_provider(self, provider_name: str):
         """Mark a provider as started."""
-        with self.lock:
-            self.in_progress.add(provider_name)
+        self.in_progress.add(provider_name)
 
     def complete_provider(self, provider_name: str):
         """Mark a provider as completed."""
-        with self.lock:
-            if provider_name in self.in_progress:
-                self.in_progress.remove(provider_name)
-            self.completed.add(provider_name)
+        self.in_progress.discard(provider_name)
+        self.completed.add(provider_name)
 
     def display_progress(self):
         """Display current progress."""
-        with self.lock:
-            elapsed = time.time() - self.start_time
-            completed_count = len(self.completed)
-            in_progress_count = len(self.in_progress)
-            pending_count = self.total_providers - completed_count - in_progress_count
-
-            status_line = f"[{elapsed:>6.1f}s] Progress: {completed_count}/{self.total_providers} completed"
-
-            if self.in_progress:
-                in_progress_list = ', '.join(sorted(self.in_progress))
-                logger.info(f"{status_line} | In progress: {in_progress_list}")
-            else:
-                logger.info(status_line)
-
-    def monitor_loop(self):
-        """Monitor loop that displays progress every 3 seconds."""
-        while not self.stop_event.is_set():
-            self.stop_event.wait(3)  # Wait for 3 seconds or until stopped
-            if not self.stop_event.is_set():
-                self.display_progress()
-
-    def stop(self):
-        """Stop the monitoring loop."""
-        self.stop_event.set()
-
-def run_provider(provider_name: str, monitor: ProgressMonitor = None) -> Dict:
+        elapsed = time.time() - self.start_time
+        completed_count = len(self.completed)
+
+        if self.in_progress:
+            in_progress_list = ', '.join(sorted(self.in_progress))
+            logger.info("[%6.1fs] Progress: %d/%d completed | In progress: %s",
+                        elapsed, completed_count, self.total_providers, in_progress_list)
+        else:
+            logger.info("[%6.1fs] Progress: %d/%d completed", elapsed, completed_count, self.total_providers)
+
+@functools.lru_cache(maxsize=None)
+def get_collector_class(provider_name: str) -> type:
+    """
+    Import a provider's collector module and return its class (memoized).
+
+    Args:
+        provider_name: Name of cloud provider
+
+    Returns:
+        Collector class
+
+    Raises:
+        ValueError: If the provider is unknown
+    """
+    if provider_name not in PROVIDERS:
+        raise ValueError(f"Unknown provider: {provider_name}")
+    module_path, class_name = PROVIDERS[provider_name]
+    return getattr(importlib.import_module(module_path), class_name)
+
+
+def run_provider(provider_name: str) -> Dict:
     """
     Run a provider script and capture results.
 
+    Runs in a worker thread or process: progress is tracked by the caller
+    from the returned future, so this function shares no state with it.
+
     Args:
         provider_name: Name of cloud provider
-        monitor: Progress monitor instance
 
     Returns:
         Dict with success status and stats
     """
-    if monitor:
-        monitor.start_provider(provider_name)
-
     start_time = time.time()
 
     try:
-        # Import and run the collector module
-        if provider_name == "Azure":
-            from collectors_ips.azure import AzureIP
-            collector = AzureIP()
-        elif provider_name == "AWS":
-            from collectors_ips.aws import AWSIP
-            collector = AWSIP()
-        elif provider_name == "GCP":
-            from collectors_ips.gcp import GCPIP
-            collector = GCPIP()
-        elif provider_name == "OCI":
-            from collectors_ips.oci import OCIIP
-            collector = OCIIP()
-        elif provider_name == "OVH":
-            from collectors_ips.ovh import OVHIP
-            collector = OVHIP()
-        elif provider_name == "Scaleway":
-            from collectors_ips.scaleway import ScalewayIP
-            collector = ScalewayIP()
-        elif provider_name == "Cloudflare":
-            from collectors_ips.cloudflare import CloudflareIP
-            collector = CloudflareIP()
-        elif provider_name == "Fastly":
-            from collectors_ips.fastly import FastlyIP
-            collector = FastlyIP()
-        elif provider_name == "Linode":
-            from collectors_ips.linode import LinodeIP
-            collector = LinodeIP()
-        elif provider_name == "DigitalOcean":
-            from collectors_ips.digitalocean import DigitalOceanIP
-            collector = DigitalOceanIP()
-        elif provider_name == "Starlink":
-            from collectors_ips.starlink import StarlinkIP
-            collector = StarlinkIP()
-        elif provider_name == "Vultr":
-            from collectors_ips.vultr import VultrIP
-            collector = VultrIP()
-        elif provider_name == "Zscaler":
-            from collectors_ips.zscaler import ZscalerIP
-            collector = ZscalerIP()
-        elif provider_name == "IBM_Cloud":
-            from collectors_ips.ibm_cloud import IBMCloudIP
-            collector = IBMCloudIP()
-        elif provider_name == "Exoscale":
-            from collectors_ips.exoscale import ExoscaleIP
-            collector = ExoscaleIP()
-        elif provider_name == "Googlebot":
-            from collectors_ips.googlebot import GooglebotIP
-            collector = GooglebotIP()
-        elif provider_name == "Outscale":
-            from collectors_ips.outscale import OutscaleIP
-            collector = OutscaleIP()
-        elif provider_name == "Bingbot":
-            from collectors_ips.bingbot import BingbotIP
-            collector = BingbotIP()
-        elif provider_name == "Meta":
-            from collectors_ips.meta import MetaIP
-            collector = MetaIP()
-        elif provider_name == "OpenAI":
-            from collectors_ips.openai import OpenAIIP
-            collector = OpenAIIP()
-        elif provider_name == "Perplexity":
-            from collectors_ips.perplexity import PerplexityIP
-            collector = PerplexityIP()
-        elif provider_name == "GitHub":
-            from collectors_ips.github import GitHubIP
-            collector = GitHubIP()
-        elif provider_name == "Ahrefs":
-            from collectors_ips.ahrefs import AhrefsIP
-            collector = AhrefsIP()
-        else:
-            raise ValueError(f"Unknown provider: {provider_name}")
+        # Instantiate the collector class (imported once per process)
+        collector = get_collector_class(provider_name)()
 
         # Generate files
         collector.generate_files()
 
         elapsed_time = time.time() - start_time
 
-        if monitor:
-            monitor.complete_provider(provider_name)
-
         return {
             'success': True,
             'error': None,
             'elapsed_time': elapsed_time
         }
 
-    except Exception as e:
+    except (Exception, SystemExit) as e:
+        # SystemExit: a collector may call sys.exit() (e.g. on a missing
+        # dependency), which must not stop the other providers
         elapsed_time = time.time() - start_time
-        logger.error(f"Failed to process {provider_name}: {e}", exc_info=True)
-
-        if monitor:
-            monitor.complete_provider(provider_name)
+        logger.error(f"Failed to process {provider_name}: {e!r}", exc_info=True)
 
         return {
             'success': False,
@@ -223,21 +187,89 @@ def run_provider(provider_name: str, monitor: ProgressMonitor = None) -> Dict:
         }
 
 
-def count_files_in_directory(directory: str) -> int:
-    """Count number of files in a directory recursively."""
-    if not os.path.exists(directory):
-        return 0
+def prewarm_dns(config_path: str, providers: List[str]) -> None:
+    """
+    Resolve the providers' download hosts in background threads.
+
+    Started before the collectors are imported, so the lookups overlap with the
+    imports instead of all happening when the workers first connect; with a
+    caching resolver (systemd-resolved, nscd, ...) the collectors' own lookups
+    are then answered locally. Failures are ignored: collectors report their
+    own download errors.
+
+    Args:
+        config_path: Path to configuration file
+        providers: Names of the providers about to run
+    """
+    try:
+        config = load_config(config_path)
+    except (OSError, ValueError):
+        return
+
+    hosts = set()
+    for provider_name in providers:
+        entry = config.get(provider_name.lower(), {})
+        urls = list(entry.get('urls', []))
+        if entry.get('url'):
+            urls.append(entry['url'])
+        hosts.update(urlsplit(url).hostname for url in urls)
+    hosts.discard(None)
+
+    if not hosts:
+        return
 
+    executor = ThreadPoolExecutor(max_workers=min(len(hosts), 32))
+    for host in hosts:
+        executor.submit(socket.getaddrinfo, host, None, type=socket.SOCK_STREAM)
+    # Do not wait: the lookups run while the collectors are imported
+    executor.shutdown(wait=False)
+
+
+def count_files_in_directory(directory: str) -> int:
+    """Count number of files in a directory recursively (0 if it does not exist)."""
+    # Iterative scandir walk: entry types come from the directory listing, no
+    # per-entry stat and no per-directory lists as with os.walk
     count = 0
-    for root, dirs, files in os.walk(directory):
-        count += len(files)
+    stack = [directory]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        count += 1
+                    elif not entry.is_symlink():
+                        # Like os.walk, symlinked directories are not descended
+                        stack.append(entry.path)
+        except OSError:
+            continue
     return count
 
 
+def log_provider_result(provider_name: str, result: Dict) -> None:
+    """
+    Log the detail line of a finished provider (status, duration, file count).
+
+    Args:
+        provider_name: Name of cloud provider
+        result: Result dict returned by run_provider
+    """
+    # Skip the directory walk when the line would not be emitted anyway
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    provider_dir = os.path.join("cloud_ips", provider_name.lower())
+    file_count = count_files_in_directory(provider_dir)
+    status = "OK" if result['success'] else "FAILED"
+    logger.info("%-20s [%-6s] %6.2fs | %3d files", provider_name, status, result['elapsed_time'], file_count)
+
+
 def generate_summary_report(results: Dict[str, Dict], total_elapsed_time: float) -> None:
     """
     Generate and log a summary report of all operations.
 
+    Per-provider details are logged as each provider finishes (see
+    log_provider_result), so only the totals and failures are reported here.
+
     Args:
         results: Dictionary mapping provider names to their results
         total_elapsed_time: Total elapsed time for all operations
@@ -246,32 +278,21 @@ def generate_summary_report(results: Dict[str, Dict], total_elapsed_time: float)
     failed = len(results) - successful
 
     # Summary
-    logger.info(f"\n{'='*70}")
+    logger.info("\n%s", SEPARATOR)
     logger.info("EXECUTION SUMMARY")
-    logger.info(f"{'='*70}")
-    logger.info(f"Total duration: {total_elapsed_time:.2f}s | Providers: {len(results)} | Success: {successful} | Failed: {failed}")
+    logger.info(SEPARATOR)
+    logger.info("Total duration: %.2fs | Providers: %d | Success: %d | Failed: %d",
+                total_elapsed_time, len(results), successful, failed)
 
     if failed > 0:
-        logger.info(f"\n{'='*70}")
+        logger.info("\n%s", SEPARATOR)
         logger.info("FAILED PROVIDERS")
-        logger.info(f"{'='*70}")
+        logger.info(SEPARATOR)
         for provider_name, result in results.items():
             if not result['success']:
                 logger.error(f"{provider_name}: {result['error']}")
 
-    # Sort results by completion time
-    sorted_results = sorted(results.items(), key=lambda x: x[1]['elapsed_time'])
-
-    logger.info(f"\n{'='*70}")
-    logger.info("PROVIDER DETAILS (sorted by duration)")
-    logger.info(f"{'='*70}")
-    for provider_name, result in sorted_results:
-        provider_dir = os.path.join("cloud_ips", provider_name.lower())
-        file_count = count_files_in_directory(provider_dir) if os.path.exists(provider_dir) else 0
-        status = "OK" if result['success'] else "FAILED"
-        logger.info(f"{provider_name:<20} [{status:<6}] {result['elapsed_time']:>6.2f}s | {file_count:>3} files")
-
-    logger.info(f"{'='*70}\n")
+    logger.info("%s\n", SEPARATOR)
 
 
 def main():
@@ -284,9 +305,7 @@ def main():
     parser.add_argument(
         "-p", "--providers",
         nargs='+',
-        choices=['azure', 'aws', 'gcp', 'oci', 'ovh', 'scaleway',
-                 'cloudflare', 'fastly', 'linode', 'digitalocean',
-                 'starlink', 'vultr', 'zscaler', 'ibm-cloud', 'exoscale', 'googlebot', 'outscale', 'bingbot', 'meta', 'openai', 'perplexity', 'github', 'ahrefs', 'all'],
+        choices=[name.lower().replace('_', '-') for name in PROVIDERS] + ['all'],
         default=['all'],
         help="Specific providers to process (default: all)"
     )
@@ -295,6 +314,12 @@ def main():
         default="config.json",
         help="Path to configuration file (default: config.json)"
     )
+    parser.add_argument(
+        "--executor",
+        choices=['thread', 'process'],
+        default='thread',
+        help="Run providers in threads, or in processes when parsing is CPU-bound (default: thread)"
+    )
 
     args = parser.parse_args()
 
@@ -303,67 +328,98 @@ def main():
         logger.error(f"Error: Configuration file '{args.config}' not found!")
         sys.exit(1)
 
-    # Define all available providers
-    all_providers = [
-        'Azure', 'AWS', 'GCP', 'OCI', 'OVH', 'Scaleway',
-        'Cloudflare', 'Fastly', 'Linode', 'DigitalOcean',
-        'Starlink', 'Vultr', 'Zscaler', 'IBM_Cloud', 'Exoscale', 'Googlebot', 'Outscale', 'Bingbot', 'Meta', 'OpenAI', 'Perplexity', 'GitHub', 'Ahrefs'
-    ]
+    # All available providers
+    all_providers = list(PROVIDERS)
 
     # Filter providers based on arguments
     if 'all' in args.providers:
         providers_to_process = all_providers
     else:
+        # Normalize the requested names once, then keep the registry order
+        requested = {p.replace('-', '').replace('_', '').lower() for p in args.providers}
         providers_to_process = [
             name for name in all_providers
-            if name.lower().replace('_', '') in [p.replace('-', '').replace('_', '') for p in args.providers]
+            if name.lower().replace('_', '') in requested
         ]
 
-    logger.info(f"\n{'='*70}")
+    logger.info("\n%s", SEPARATOR)
     logger.info("MULTI-CLOUD IP RANGES COLLECTOR")
-    logger.info(f"{'='*70}")
-    logger.info(f"Configuration: {args.config}")
-    logger.info(f"Providers: {len(providers_to_process)} ({', '.join(providers_to_process)})")
-    logger.info(f"{'='*70}\n")
+    logger.info(SEPARATOR)
+    logger.info("Configuration: %s", args.config)
+    logger.info("Providers: %d (%s)", len(providers_to_process), ', '.join(providers_to_process))
+    logger.info("%s\n", SEPARATOR)
 
     # Start global timer
     global_start_time = time.time()
 
+    # Resolve download hosts while the collectors are being imported
+    prewarm_dns(args.config, providers_to_process)
+
+    # Import the collectors up front, one after the other, rather than from
+    # every worker thread at once (worker processes only inherit them under
+    # the fork start method; with spawn or forkserver they import their own).
+    # A failing import, including a collector calling sys.exit() while being
+    # imported, is not cached: run_provider reports it for its provider.
+    for provider_name in providers_to_process:
+        try:
+            get_collector_class(provider_name)
+        except (Exception, SystemExit):
+            pass
+
     # Create progress monitor
     monitor = ProgressMonitor(len(providers_to_process))
 
-    # Start monitoring thread
-    monitor_thread = threading.Thread(target=monitor.monitor_loop, daemon=True)
-    monitor_thread.start()
-
     # Run each provider in parallel
     results = {}
-    max_workers = os.cpu_count()
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all providers to the thread pool
+    # Processes sidestep the GIL for collectors that spend their time parsing,
+    # so they are bounded by the cores
+    if args.executor == 'process':
+        max_workers = min(len(providers_to_process), os.cpu_count() or 1)
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+    else:
+        # Threads mostly wait on the network: run every provider at once
+        # (capped like ThreadPoolExecutor's own default) rather than one per core
+        max_workers = min(len(providers_to_process), 32)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    with executor:
+        # Submit all providers to the pool
         future_to_provider = {
-            executor.submit(run_provider, provider_name, monitor): provider_name
+            executor.submit(run_provider, provider_name): provider_name
             for provider_name in providers_to_process
         }
 
-        # Collect results as they complete
-        for future in as_completed(future_to_provider):
-            provider_name = future_to_provider[future]
-            try:
-                results[provider_name] = future.result()
-            except Exception as exc:
-                logger.error(f"Provider {provider_name} generated an exception: {exc}")
-                results[provider_name] = {
-                    'success': False,
-                    'error': str(exc),
-                    'elapsed_time': 0
-                }
+        # Collect results as they complete; the wait timeout doubles as the
+        # progress tick, so no separate monitoring thread is needed
+        pending = set(future_to_provider)
+        next_display = time.time() + PROGRESS_INTERVAL
+        while pending:
+            done, pending = wait(pending, timeout=max(0, next_display - time.time()), return_when=FIRST_COMPLETED)
+
+            for future in done:
+                provider_name = future_to_provider[future]
+                try:
+                    results[provider_name] = future.result()
+                except Exception as exc:
+                    logger.error(f"Provider {provider_name} generated an exception: {exc}")
+                    results[provider_name] = {
+                        'success': False,
+                        'error': str(exc),
+                        'elapsed_time': 0
+                    }
                 monitor.complete_provider(provider_name)
 
-    # Stop monitoring thread
-    monitor.stop()
-    monitor_thread.join(timeout=1)
+                # Report each provider as soon as it finishes (completion order)
+                log_provider_result(provider_name, results[provider_name])
+
+            if pending and time.time() >= next_display:
+                # Futures report when a worker (thread or process) picks them up
+                for future in pending:
+                    if future.running():
+                        monitor.start_provider(future_to_provider[future])
+                monitor.display_progress()
+                next_display = time.time() + PROGRESS_INTERVAL
 
     # Calculate total elapsed time
     total_elapsed_time = time.time() - global_start_time